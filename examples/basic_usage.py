@@ -8,6 +8,9 @@ with a viewer and some sample data.
 import numpy as np
 import t_gui
 
+# Shared random generator (PCG64) for the sample data
+_rng = np.random.default_rng()
+
 
 def main():
     """Main function demonstrating basic T-GUI usage."""
@@ -16,16 +19,17 @@ def main():
     viewer = t_gui.make_viewer()
     
     # Add some sample image data
-    image_data = np.random.random((100, 100))
+    image_data = _rng.random((100, 100))
     viewer.add_image(image_data, name="Random Image", colormap='viridis')
     
     # Add some sample points data
-    points_data = np.random.random((50, 2)) * 100
+    points_data = _rng.random((50, 2), dtype=np.float32)
+    points_data *= 100  # scale in place; float32 matches vertex buffers
     viewer.add_points(points_data, name="Random Points", size=5, face_color='red')
     
     # Add another image layer
-    gradient = np.linspace(0, 1, 100)
-    gradient_2d = np.outer(gradient, gradient)
+    gradient = np.linspace(0, 1, 100, dtype=np.float32)
+    gradient_2d = np.multiply.outer(gradient, gradient)  # C-contiguous float32
     viewer.add_image(gradient_2d, name="Gradient", colormap='plasma', opacity=0.7)
     
     # Launch the application
@@ -38,10 +42,11 @@ def create_custom_viewer():
     # Create viewer with custom title
     viewer = t_gui.Viewer(title="My Custom Viewer")
     
-    # Add multiple layers
-    for i in range(3):
-        data = np.random.random((50, 50)) * (i + 1)
-        viewer.add_image(data, name=f"Layer {i+1}")
+    # Add multiple layers, notifying listeners once for the whole batch
+    with viewer.batch_updates():
+        for i in range(3):
+            data = _rng.random((50, 50)) * (i + 1)
+            viewer.add_image(data, name=f"Layer {i+1}")
     
     # Create main window and set the viewer
     window = t_gui.MainWindow()
@@ -54,7 +59,16 @@ def create_custom_viewer():
 
 
 def demonstrate_events():
-    """Demonstrate the event system."""
+    """
+    Demonstrate the event system.
+    
+    Callbacks are held by weak reference: bound methods through
+    ``weakref.WeakMethod`` and plain functions through ``weakref.ref``.
+    Handlers therefore do not keep their owners (or a viewer captured in
+    a closure) alive, and are dropped once they are garbage collected.
+    Pass ``weak=False`` to ``EventManager.connect`` to hold a strong
+    reference instead.
+    """
     
     viewer = t_gui.make_viewer()
     
@@ -71,8 +85,8 @@ def demonstrate_events():
     viewer.connect('layer_removed', on_layer_removed)
     
     # Add and remove layers to see events
-    layer1 = viewer.add_image(np.random.random((50, 50)), name="Test Layer 1")
-    layer2 = viewer.add_image(np.random.random((50, 50)), name="Test Layer 2")
+    layer1 = viewer.add_image(_rng.random((50, 50)), name="Test Layer 1")
+    layer2 = viewer.add_image(_rng.random((50, 50)), name="Test Layer 2")
     
     viewer.remove_layer(layer1)
     
@@ -5,21 +5,31 @@ This example demonstrates how to create a plugin that extends
 T-GUI with custom functionality.
 """
 
+from collections import deque
+
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QTimer
 import numpy as np
 
-from t_gui.plugins.hookspecs import hookspec
+from t_gui.plugins.hookspecs import hookimpl
 from t_gui.app_model.actions import action
+from t_gui.utils.shared_array import create_shared_array
 
 
 class ExampleWidget(QWidget):
     """Example widget that can be added as a plugin contribution."""
     
+    # ``object`` is carried as PyQt_PyObject: same-thread slots receive the
+    # emitted array itself, without QVariant conversion or copying
     data_generated = pyqtSignal(object)  # numpy array
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._rng = np.random.default_rng()
+        self._data_buf = np.empty((100, 100))
+        # Pending log lines, flushed to the log area at most every 50 ms
+        self._log_buf = deque(maxlen=200)
+        self._flush_pending = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -28,7 +38,7 @@ class ExampleWidget(QWidget):
         
         # Title
         title = QLabel("Example Plugin Widget")
-        title.setStyleSheet("font-weight: bold; font-size: 14px;")
+        title.setObjectName("tg-title")  # styled by the T-GUI app stylesheet
         layout.addWidget(title)
         
         # Description
@@ -50,9 +60,23 @@ class ExampleWidget(QWidget):
     
     def _generate_data(self):
         """Generate random data and emit signal."""
-        data = np.random.random((100, 100))
-        self.data_generated.emit(data)
-        self.log_area.append("Generated 100x100 random data array")
+        self._rng.random(out=self._data_buf)
+        self.data_generated.emit(self._data_buf.copy())
+        self._log("Generated 100x100 random data array")
+    
+    def _log(self, message):
+        """Queue a log message for the next flush."""
+        self._log_buf.append(message)
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Append all queued log messages in a single update."""
+        self._flush_pending = False
+        if self._log_buf:
+            self.log_area.append("\n".join(self._log_buf))
+            self._log_buf.clear()
 
 
 class ExamplePlugin:
@@ -67,8 +91,9 @@ class ExamplePlugin:
     
     def __init__(self):
         self.widget = None
+        self._rng = np.random.default_rng()
     
-    @hookspec
+    @hookimpl
     def t_gui_get_widget_contributions(self):
         """Contribute a custom widget."""
         return [
@@ -79,7 +104,7 @@ class ExamplePlugin:
             }
         ]
     
-    @hookspec
+    @hookimpl
     def t_gui_get_action_contributions(self):
         """Contribute custom actions."""
         return [
@@ -98,7 +123,7 @@ class ExamplePlugin:
             }
         ]
     
-    @hookspec
+    @hookimpl
     def t_gui_get_menu_contributions(self):
         """Contribute menu items."""
         return [
@@ -113,7 +138,7 @@ class ExamplePlugin:
             }
         ]
     
-    @hookspec
+    @hookimpl
     def t_gui_get_reader_contributions(self):
         """Contribute file readers."""
         return [
@@ -124,7 +149,7 @@ class ExamplePlugin:
             }
         ]
     
-    @hookspec
+    @hookimpl
     def t_gui_setup_plugin(self, plugin_manager):
         """Setup the plugin when loaded."""
         print("Example plugin loaded!")
@@ -133,7 +158,7 @@ class ExamplePlugin:
         from t_gui.app_model.context import get_app_context
         self.context = get_app_context()
     
-    @hookspec
+    @hookimpl
     def t_gui_teardown_plugin(self, plugin_manager):
         """Cleanup when plugin is unloaded."""
         print("Example plugin unloaded!")
@@ -155,9 +180,14 @@ class ExamplePlugin:
         if self.context and self.context.active_viewer:
             viewer = self.context.active_viewer
             
-            # Generate some example data
-            data = np.random.random((200, 200))
-            viewer.add_image(data, name="Plugin Generated Data")
+            # Generate some example data in shared memory, so the viewer
+            # can map it without a copy even from another process
+            data = create_shared_array((200, 200), dtype=np.float32)
+            self._rng.random(dtype=np.float32, out=data)
+            viewer.add_image_shm(data.shm_name, data.shape, data.dtype,
+                                 name="Plugin Generated Data")
+            # The viewer holds its own mapping; release the name
+            data.unlink()
             
             print("Generated example data in viewer")
         else:
@@ -171,7 +201,7 @@ class ExamplePlugin:
         
         # Return dummy data
         return {
-            'data': np.random.random((100, 100)),
+            'data': self._rng.random((100, 100)),
             'metadata': {
                 'file_path': file_path,
                 'file_type': 'example'
@@ -193,9 +223,9 @@ def setup_plugin():
 # For testing the plugin standalone
 if __name__ == "__main__":
     import sys
-    from PyQt5.QtWidgets import QApplication
+    from t_gui._qt import get_app
     
-    app = QApplication(sys.argv)
+    app = get_app()
     
     # Create and show the example widget
     widget = ExampleWidget()
@@ -2,7 +2,7 @@
 Setup script for T-GUI.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # Read README file
 try:
@@ -31,7 +31,18 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/your-username/t-gui",
-    packages=find_packages(),
+    packages=[
+        "t_gui",
+        "t_gui._qt",
+        "t_gui._qt.widgets",
+        "t_gui.app_model",
+        "t_gui.app_model.actions",
+        "t_gui.components",
+        "t_gui.events",
+        "t_gui.plugins",
+        "t_gui.settings",
+        "t_gui.utils",
+    ],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -63,6 +74,7 @@ setup(
             "sphinx-rtd-theme>=1.0",
             "myst-parser>=0.15",
         ],
+        "speedups": ["orjson>=3.0"],
         "pyside2": ["PySide2>=5.12.0"],
         "pyqt6": ["PyQt6>=6.0.0"],
         "pyside6": ["PySide6>=6.0.0"],
@@ -72,7 +84,8 @@ setup(
             "t-gui=t_gui:run",
         ],
     },
-    include_package_data=True,
+    include_package_data=False,
+    zip_safe=False,
     package_data={
         "t_gui": [
             "resources/icons/*.png",
@@ -7,16 +7,43 @@ similar to napari but more general-purpose.
 
 __version__ = "0.1.0"
 
-from .components.viewer import Viewer
-from .app_model.context import AppContext
-from ._qt.main_window import MainWindow
-from .plugins.manager import PluginManager
+import importlib
+import logging
+
+# Public names resolved on first access, so that ``import t_gui`` does not
+# pull in Qt or the plugin system until they are actually needed
+_LAZY = {
+    'Viewer': ('t_gui.components.viewer', 'Viewer'),
+    'AppContext': ('t_gui.app_model.context', 'AppContext'),
+    'MainWindow': ('t_gui._qt.main_window', 'MainWindow'),
+    'PluginManager': ('t_gui.plugins.manager', 'PluginManager'),
+}
+
+logger = logging.getLogger(__name__)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attribute = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 # Main application entry point
 def run(*, show=True, block=True):
     """
     Launch the T-GUI application.
     
+    When blocking, the main window is built from the first iteration of
+    the event loop, so the loop starts (and the platform window is set up)
+    without waiting for the widgets to be constructed.
+    
     Parameters
     ----------
     show : bool, optional
@@ -29,18 +56,34 @@ def run(*, show=True, block=True):
     MainWindow
         The main application window.
     """
-    from ._qt import get_app
+    from ._qt import get_app, QTimer
+    from ._qt.main_window import MainWindow
     
     app = get_app()
-    window = MainWindow()
+    holder = {}
     
-    if show:
-        window.show()
+    def _build():
+        try:
+            holder['window'] = window = MainWindow()
+            if show:
+                window.show()
+        except Exception as e:
+            # An exception escaping a slot aborts the process under PyQt5,
+            # so stop the loop and re-raise once it has returned
+            logger.exception("Error building the main window")
+            holder['error'] = e
+            app.quit()
     
     if block:
+        QTimer.singleShot(0, _build)
         app.exec_()
+    else:
+        _build()
     
-    return window
+    error = holder.get('error')
+    if error is not None:
+        raise error
+    return holder.get('window')
 
 def make_viewer(**kwargs):
     """
@@ -56,6 +99,8 @@ def make_viewer(**kwargs):
     Viewer
         A new viewer instance.
     """
+    from .components.viewer import Viewer
+    
     return Viewer(**kwargs)
 
 # Convenience imports for common use cases
@@ -5,36 +5,59 @@ This module contains all Qt-specific code for the user interface,
 keeping it separate from the core application logic.
 """
 
+import importlib
+import os
 import sys
 from typing import Optional
 
-# Qt imports with fallback support
-try:
-    from PyQt5.QtWidgets import QApplication
-    from PyQt5.QtCore import Qt
-    QT_BACKEND = "PyQt5"
-except ImportError:
-    try:
-        from PySide2.QtWidgets import QApplication
-        from PySide2.QtCore import Qt
-        QT_BACKEND = "PySide2"
-    except ImportError:
-        try:
-            from PyQt6.QtWidgets import QApplication
-            from PyQt6.QtCore import Qt
-            QT_BACKEND = "PyQt6"
-        except ImportError:
-            try:
-                from PySide6.QtWidgets import QApplication
-                from PySide6.QtCore import Qt
-                QT_BACKEND = "PySide6"
-            except ImportError:
-                raise ImportError(
-                    "No Qt backend found. Please install PyQt5, PySide2, PyQt6, or PySide6."
-                )
-
-from .main_window import MainWindow
-from .widgets import *
+from ._qtcompat import (
+    QT_BACKEND, QApplication, Qt, QTimer, QColor as _QColor, QPalette as _QPalette,
+)
+
+# Widgets resolved on first access, so that ``get_app()`` and the themes
+# do not import the main window and its dependencies
+_LAZY = {
+    'MainWindow': ('t_gui._qt.main_window', 'MainWindow'),
+    'LayerListWidget': ('t_gui._qt.widgets.layer_list_widget', 'LayerListWidget'),
+    'ViewerWidget': ('t_gui._qt.widgets.viewer_widget', 'ViewerWidget'),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attribute = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+# Application-wide stylesheet. Widgets opt in through their object name,
+# so Qt parses the rules once instead of once per widget instance.
+_APP_STYLESHEET = """
+QLabel#tg-title { font-weight: bold; font-size: 14px; }
+QLabel#tg-header { font-weight: bold; }
+QLabel#tg-viewer-title { font-weight: bold; color: #ddd; }
+QWidget#tg-viewer-canvas { background-color: #2b2b2b; border: 1px solid #555; }
+"""
+
+
+# Dynamic property marking an application whose stylesheet is installed
+_STYLESHEET_PROPERTY = "t_gui_stylesheet"
+
+
+def _install_stylesheet(app: QApplication):
+    """Append the T-GUI stylesheet to the application stylesheet, once per application."""
+    if app.property(_STYLESHEET_PROPERTY):
+        return
+    style_sheet = app.styleSheet()
+    if _APP_STYLESHEET not in style_sheet:
+        app.setStyleSheet(style_sheet + _APP_STYLESHEET)
+    app.setProperty(_STYLESHEET_PROPERTY, True)
+
 
 # Global application instance
 _app_instance: Optional[QApplication] = None
@@ -44,6 +67,11 @@ def get_app() -> QApplication:
     """
     Get or create the Qt application instance.
     
+    The command line is not forwarded to Qt unless the ``T_GUI_PASS_ARGV``
+    environment variable is set, since T-GUI does not use Qt's own
+    command-line options. The platform style is kept unless the
+    ``T_GUI_STYLE`` environment variable names another (e.g. "Fusion").
+    
     Returns
     -------
     QApplication
@@ -57,11 +85,26 @@ def get_app() -> QApplication:
         if existing_app is not None:
             _app_instance = existing_app
         else:
+            # High-DPI attributes must be set before the application is
+            # created; Qt6 enables them unconditionally
+            if QT_BACKEND in ("PyQt5", "PySide2"):
+                QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+                QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+            
             # Create new application
-            _app_instance = QApplication(sys.argv)
+            argv = sys.argv if os.environ.get("T_GUI_PASS_ARGV") else []
+            _app_instance = QApplication(argv)
+            # Resolve the style up front rather than on the first paint
+            style_name = os.environ.get("T_GUI_STYLE")
+            if style_name:
+                _app_instance.setStyle(style_name)
+            else:
+                _app_instance.style()
             _app_instance.setApplicationName("T-GUI")
             _app_instance.setApplicationVersion("0.1.0")
             _app_instance.setOrganizationName("T-GUI")
+        
+        _install_stylesheet(_app_instance)
     
     return _app_instance
 
@@ -79,51 +122,64 @@ def set_app_style(style_name: str = "Fusion"):
     app.setStyle(style_name)
 
 
-def apply_dark_theme():
-    """Apply a dark theme to the application."""
-    app = get_app()
-
-    # Dark palette - import based on available backend
-    try:
-        from PyQt5.QtGui import QPalette, QColor
-        from PyQt5.QtCore import Qt
-    except ImportError:
-        try:
-            from PySide2.QtGui import QPalette, QColor
-            from PySide2.QtCore import Qt
-        except ImportError:
-            print("Warning: Could not apply dark theme - no Qt backend found")
-            return
-    
-    palette = QPalette()
-    
+# Dark theme colors per palette role
+_DARK_ROLES = {
     # Window colors
-    palette.setColor(QPalette.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-    
+    _QPalette.Window: _QColor(53, 53, 53),
+    _QPalette.WindowText: _QColor(255, 255, 255),
     # Base colors
-    palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-    
+    _QPalette.Base: _QColor(25, 25, 25),
+    _QPalette.AlternateBase: _QColor(53, 53, 53),
     # Text colors
-    palette.setColor(QPalette.Text, QColor(255, 255, 255))
-    palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
-    
+    _QPalette.Text: _QColor(255, 255, 255),
+    _QPalette.BrightText: _QColor(255, 0, 0),
     # Button colors
-    palette.setColor(QPalette.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-    
+    _QPalette.Button: _QColor(53, 53, 53),
+    _QPalette.ButtonText: _QColor(255, 255, 255),
     # Highlight colors
-    palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
+    _QPalette.Highlight: _QColor(42, 130, 218),
+    _QPalette.HighlightedText: _QColor(0, 0, 0),
+}
+
+
+def _fill_palette(palette, roles):
+    """Set the colors of a palette from a role -> color mapping."""
+    for role, color in roles.items():
+        palette.setColor(role, color)
+    return palette
+
+
+# Theme palettes, built once after the application exists so that
+# unset roles inherit the application defaults
+_DARK_PALETTE = None
+_LIGHT_PALETTE = None
+
+
+def apply_dark_theme():
+    """Apply a dark theme to the application."""
+    global _DARK_PALETTE
     
-    app.setPalette(palette)
+    app = get_app()
+    if _DARK_PALETTE is None:
+        _DARK_PALETTE = _fill_palette(_QPalette(), _DARK_ROLES)
+    app.setPalette(_DARK_PALETTE)
+
+
+def apply_light_theme():
+    """Apply the default light theme of the current style."""
+    global _LIGHT_PALETTE
+    
+    app = get_app()
+    if _LIGHT_PALETTE is None:
+        _LIGHT_PALETTE = app.style().standardPalette()
+    app.setPalette(_LIGHT_PALETTE)
 
 
 __all__ = [
     'get_app',
     'set_app_style', 
     'apply_dark_theme',
+    'apply_light_theme',
     'MainWindow',
     'QT_BACKEND'
 ]
@@ -0,0 +1,77 @@
+"""
+Qt binding compatibility layer.
+
+The Qt binding is resolved once, here, and its classes are re-exported
+so that the rest of ``t_gui._qt`` imports them from one place::
+
+    from ._qtcompat import Qt, QMainWindow, pyqtSignal
+
+Signals and slots are available under both the PyQt names
+(``pyqtSignal``, ``pyqtSlot``) and the PySide names (``Signal``, ``Slot``).
+"""
+
+import importlib
+from typing import Dict
+
+# Supported Qt backends, in order of preference
+_BACKENDS = [
+    ("PyQt5", "PyQt5"),
+    ("PySide2", "PySide2"),
+    ("PyQt6", "PyQt6"),
+    ("PySide6", "PySide6"),
+]
+
+# Resolved backend modules (QtWidgets, QtCore, QtGui)
+_qt_mods: Dict[str, object] = {}
+
+
+def _resolve_backend() -> str:
+    """
+    Resolve the Qt backend once and cache its modules.
+
+    Returns
+    -------
+    str
+        Name of the resolved backend.
+    """
+    if _qt_mods:
+        return _qt_mods["backend"]
+
+    for name, package in _BACKENDS:
+        try:
+            qt_widgets = importlib.import_module(f"{package}.QtWidgets")
+            qt_core = importlib.import_module(f"{package}.QtCore")
+            qt_gui = importlib.import_module(f"{package}.QtGui")
+        except ImportError:
+            continue
+        _qt_mods.update(
+            backend=name, QtWidgets=qt_widgets, QtCore=qt_core, QtGui=qt_gui
+        )
+        return name
+
+    raise ImportError(
+        "No Qt backend found. Please install PyQt5, PySide2, PyQt6, or PySide6."
+    )
+
+
+QT_BACKEND = _resolve_backend()
+QtWidgets = _qt_mods["QtWidgets"]
+QtCore = _qt_mods["QtCore"]
+QtGui = _qt_mods["QtGui"]
+
+# Re-export the Qt classes and namespaces. QtWidgets goes last so that it
+# wins for names defined in more than one module.
+for _module in (QtCore, QtGui, QtWidgets):
+    globals().update(
+        (_name, getattr(_module, _name))
+        for _name in dir(_module)
+        if _name.startswith("Q")
+    )
+del _module
+
+if QT_BACKEND.startswith("PyQt"):
+    pyqtSignal = Signal = QtCore.pyqtSignal
+    pyqtSlot = Slot = QtCore.pyqtSlot
+else:
+    pyqtSignal = Signal = QtCore.Signal
+    pyqtSlot = Slot = QtCore.Slot
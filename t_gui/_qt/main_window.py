@@ -2,26 +2,15 @@
 Main window for T-GUI application.
 """
 
+import logging
+from functools import partial
 from typing import Optional
-try:
-    from PyQt5.QtWidgets import (
-        QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
-        QMenuBar, QMenu, QAction, QStatusBar, QDockWidget, QMessageBox,
-        QFileDialog, QApplication
-    )
-    from PyQt5.QtCore import Qt, pyqtSignal
-    from PyQt5.QtGui import QKeySequence
-except ImportError:
-    try:
-        from PySide2.QtWidgets import (
-            QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
-            QMenuBar, QMenu, QAction, QStatusBar, QDockWidget, QMessageBox,
-            QFileDialog, QApplication
-        )
-        from PySide2.QtCore import Qt, Signal as pyqtSignal
-        from PySide2.QtGui import QKeySequence
-    except ImportError:
-        raise ImportError("No Qt backend found. Please install PyQt5 or PySide2.")
+from ._qtcompat import (
+    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
+    QMenuBar, QMenu, QAction, QStatusBar, QDockWidget, QMessageBox,
+    QFileDialog, QApplication, Qt, QObject, QRunnable, QThreadPool, QTimer,
+    QKeySequence, pyqtSignal
+)
 
 from ..components.viewer import Viewer
 from ..components.layer_list import LayerList
@@ -31,6 +20,97 @@ from ..plugins.manager import get_plugin_manager
 from .widgets.viewer_widget import ViewerWidget
 from .widgets.layer_list_widget import LayerListWidget
 
+logger = logging.getLogger(__name__)
+
+
+# Dock areas for the 'area' of plugin widget contributions
+_DOCK_AREAS = {
+    'left': Qt.LeftDockWidgetArea,
+    'right': Qt.RightDockWidgetArea,
+    'bottom': Qt.BottomDockWidgetArea,
+}
+
+
+# Key sequences of standard keys, by int value (the enums are unhashable)
+_KEY_SEQUENCES = {}
+
+
+def _key_sequence(standard_key) -> QKeySequence:
+    """
+    Get the key sequence of a standard key, shared across windows.
+    
+    Built on first use rather than at import, since resolving standard
+    keys needs the platform theme of a running QApplication.
+    """
+    key = int(standard_key)
+    sequence = _KEY_SEQUENCES.get(key)
+    if sequence is None:
+        sequence = _KEY_SEQUENCES[key] = QKeySequence(standard_key)
+    return sequence
+
+
+class _LoadSignals(QObject):
+    """Signals of a LoadWorker (QRunnable is not a QObject)."""
+    
+    loaded = pyqtSignal(object, str)  # data, layer name
+
+
+class LoadWorker(QRunnable):
+    """
+    Load layer data on a thread pool thread.
+    
+    Parameters
+    ----------
+    file_path : str
+        Path of the file to load.
+    """
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _LoadSignals()
+    
+    def run(self):
+        """Load the data and emit ``signals.loaded``."""
+        try:
+            # This is a placeholder - actual file loading would depend on file type
+            import numpy as np
+            data = np.random.default_rng().random((100, 100), dtype=np.float32)
+            self.signals.loaded.emit(data, f"Data from {self.file_path}")
+        except Exception:
+            logger.exception("Error loading %s", self.file_path)
+
+
+class LazyDock(QDockWidget):
+    """
+    Dock widget that constructs its content the first time it is shown.
+    
+    Parameters
+    ----------
+    title : str
+        Dock title.
+    parent : QWidget
+        Parent window.
+    widget_class : callable
+        Called with no arguments to create the dock's widget.
+    """
+    
+    def __init__(self, title: str, parent, widget_class):
+        super().__init__(title, parent)
+        self._widget_class = widget_class
+        # Unlike showEvent, this also tracks the selected tab of tabbed docks
+        self.visibilityChanged.connect(self._on_visibility_changed)
+    
+    def _on_visibility_changed(self, visible: bool):
+        """Build the content widget when the dock first becomes visible."""
+        if not visible or self._widget_class is None:
+            return
+        widget_class, self._widget_class = self._widget_class, None
+        try:
+            self.setWidget(widget_class())
+        except Exception:
+            logger.exception("Error creating dock widget %r", self.windowTitle())
+
 
 class MainWindow(QMainWindow):
     """
@@ -50,6 +130,8 @@ class MainWindow(QMainWindow):
         self._context = get_app_context()
         self._action_manager = get_action_manager()
         self._plugin_manager = get_plugin_manager()
+        # Contributed menu entries not yet turned into actions, by menu
+        self._pending_menu_actions = {}
         
         self._setup_ui()
         self._setup_menus()
@@ -57,8 +139,9 @@ class MainWindow(QMainWindow):
         self._setup_dock_widgets()
         self._connect_signals()
         
-        # Create default viewer
-        self.new_viewer()
+        # Create the default viewer once the event loop runs, so the
+        # window can paint first
+        QTimer.singleShot(0, self._create_default_viewer)
     
     def _setup_ui(self):
         """Setup the main user interface."""
@@ -97,26 +180,26 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("&File")
         
         self.new_action = QAction("&New Viewer", self)
-        self.new_action.setShortcut(QKeySequence.New)
+        self.new_action.setShortcut(_key_sequence(QKeySequence.New))
         self.new_action.triggered.connect(self.new_viewer)
         file_menu.addAction(self.new_action)
         
         file_menu.addSeparator()
         
         self.open_action = QAction("&Open...", self)
-        self.open_action.setShortcut(QKeySequence.Open)
+        self.open_action.setShortcut(_key_sequence(QKeySequence.Open))
         self.open_action.triggered.connect(self.open_file)
         file_menu.addAction(self.open_action)
         
         self.save_action = QAction("&Save", self)
-        self.save_action.setShortcut(QKeySequence.Save)
+        self.save_action.setShortcut(_key_sequence(QKeySequence.Save))
         self.save_action.triggered.connect(self.save_file)
         file_menu.addAction(self.save_action)
         
         file_menu.addSeparator()
         
         self.exit_action = QAction("E&xit", self)
-        self.exit_action.setShortcut(QKeySequence.Quit)
+        self.exit_action.setShortcut(_key_sequence(QKeySequence.Quit))
         self.exit_action.triggered.connect(self.close)
         file_menu.addAction(self.exit_action)
         
@@ -194,6 +277,11 @@ class MainWindow(QMainWindow):
         self._context.connect('widget_contributions', self._on_widget_contributions)
         self._context.connect('menu_contributions', self._on_menu_contributions)
     
+    def _create_default_viewer(self):
+        """Create the initial viewer, unless one was set in the meantime."""
+        if self._current_viewer is None:
+            self.new_viewer()
+    
     def new_viewer(self):
         """Create a new viewer."""
         viewer = Viewer(title=f"Viewer {len(self._context.viewers) + 1}")
@@ -209,6 +297,9 @@ class MainWindow(QMainWindow):
         viewer : Viewer or None
             The viewer to set as current.
         """
+        if viewer is self._current_viewer:
+            return
+        
         self._current_viewer = viewer
         self.viewer_widget.set_viewer(viewer)
         
@@ -234,14 +325,18 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            # This is a placeholder - actual file loading would depend on file type
-            self.status_bar.showMessage(f"Opened: {file_path}")
+            self.status_bar.showMessage(f"Opening: {file_path}")
             
-            # For demonstration, add a dummy layer
-            if self._current_viewer:
-                import numpy as np
-                dummy_data = np.random.random((100, 100))
-                self._current_viewer.add_image(dummy_data, name=f"Data from {file_path}")
+            # Load off the UI thread; the layer is added when data arrives
+            worker = LoadWorker(file_path)
+            worker.signals.loaded.connect(self._on_file_loaded)
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_file_loaded(self, data, name: str):
+        """Add loaded data to the current viewer."""
+        self.status_bar.showMessage(f"Opened: {name}")
+        if self._current_viewer:
+            self._current_viewer.add_image(data, name=name)
     
     def save_file(self):
         """Save current data to file."""
@@ -305,37 +400,52 @@ class MainWindow(QMainWindow):
         plugin_name = event.data['plugin_name']
         contributions = event.data['contributions']
         
-        for contrib in contributions:
-            # Add widget contributions as dock widgets
-            widget_class = contrib['widget']
-            name = contrib['name']
-            area = contrib.get('area', 'right')
-            
-            try:
-                widget = widget_class()
-                dock = QDockWidget(name, self)
-                dock.setWidget(widget)
-                
-                # Determine dock area
-                if area == 'left':
-                    dock_area = Qt.LeftDockWidgetArea
-                elif area == 'right':
-                    dock_area = Qt.RightDockWidgetArea
-                elif area == 'bottom':
-                    dock_area = Qt.BottomDockWidgetArea
-                else:
-                    dock_area = Qt.RightDockWidgetArea
+        # First dock added per area; later ones are tabbed onto it
+        area_docks = {}
+        
+        # Dock all contributions before repainting the window once
+        self.setUpdatesEnabled(False)
+        prev = self.blockSignals(True)
+        try:
+            for contrib in contributions:
+                # Add widget contributions as dock widgets
+                widget_class = contrib['widget']
+                name = contrib['name']
+                area = contrib.get('area', 'right')
+                if area not in _DOCK_AREAS:
+                    area = 'right'
                 
-                self.addDockWidget(dock_area, dock)
-                
-            except Exception as e:
-                print(f"Error adding widget contribution from {plugin_name}: {e}")
+                try:
+                    # The widget itself is built when the dock is first shown
+                    dock = LazyDock(name, self, widget_class)
+                    
+                    if area in area_docks:
+                        self.tabifyDockWidget(area_docks[area], dock)
+                    else:
+                        self.addDockWidget(_DOCK_AREAS[area], dock)
+                        area_docks[area] = dock
+                    
+                except Exception:
+                    logger.exception("Error adding widget contribution from %s", plugin_name)
+            
+            # Keep the first contribution of each area as the front tab
+            for dock in area_docks.values():
+                dock.raise_()
+        finally:
+            self.blockSignals(prev)
+            self.setUpdatesEnabled(True)
     
     def _on_menu_contributions(self, event):
         """Handle menu contributions from plugins."""
         plugin_name = event.data['plugin_name']
         contributions = event.data['contributions']
         
+        # Menus by title, looked up once per event
+        menus = {
+            action.text().replace('&', ''): action.menu()
+            for action in self.menuBar().actions()
+        }
+        
         for contrib in contributions:
             # Add menu contributions
             menu_path = contrib['menu']
@@ -351,26 +461,46 @@ class MainWindow(QMainWindow):
                     action_name = menu_parts[1]
                     
                     # Find or create menu
-                    menu = None
-                    for action in self.menuBar().actions():
-                        if action.text().replace('&', '') == menu_name:
-                            menu = action.menu()
-                            break
-                    
+                    menu = menus.get(menu_name)
                     if not menu:
-                        menu = self.menuBar().addMenu(menu_name)
+                        menu = menus[menu_name] = self.menuBar().addMenu(menu_name)
                     
-                    # Add action to menu
-                    action = QAction(action_name, self)
                     if shortcut:
-                        action.setShortcut(shortcut)
-                    action.triggered.connect(
-                        lambda: self._action_manager.execute_action(action_id)
-                    )
-                    menu.addAction(action)
+                        # Shortcuts only work once the action exists
+                        self._add_menu_action(menu, action_name, action_id, shortcut)
+                    else:
+                        # Build the action when the menu is first opened
+                        if menu not in self._pending_menu_actions:
+                            self._pending_menu_actions[menu] = []
+                            menu.aboutToShow.connect(partial(self._build_menu_actions, menu))
+                        self._pending_menu_actions[menu].append((action_name, action_id))
                     
-            except Exception as e:
-                print(f"Error adding menu contribution from {plugin_name}: {e}")
+            except Exception:
+                logger.exception("Error adding menu contribution from %s", plugin_name)
+    
+    def _add_menu_action(self, menu, action_name: str, action_id: str, shortcut=None):
+        """Add an action running a registered action to a menu."""
+        action = QAction(action_name, self)
+        if shortcut:
+            action.setShortcut(shortcut)
+        action.triggered.connect(partial(self._trigger_action, action_id))
+        menu.addAction(action)
+    
+    def _build_menu_actions(self, menu):
+        """Add the pending contributed actions of a menu."""
+        # The (now empty) list stays, marking aboutToShow as connected
+        pending = self._pending_menu_actions.get(menu, [])
+        for action_name, action_id in pending:
+            self._add_menu_action(menu, action_name, action_id)
+        pending.clear()
+    
+    def _trigger_action(self, action_id: str, checked: bool = False):
+        """Execute a registered action from a menu entry."""
+        # An exception escaping a slot would abort the application
+        try:
+            self._action_manager.execute_action(action_id)
+        except Exception:
+            logger.exception("Error executing action %s", action_id)
     
     def closeEvent(self, event):
         """Handle window close event."""
@@ -4,7 +4,27 @@ Qt widgets for T-GUI.
 This module contains custom Qt widgets used throughout the application.
 """
 
-from .layer_list_widget import LayerListWidget
-from .viewer_widget import ViewerWidget
+import importlib
+
+# Widgets resolved on first access, so importing one widget module does
+# not import the others
+_LAZY = {
+    'LayerListWidget': ('t_gui._qt.widgets.layer_list_widget', 'LayerListWidget'),
+    'ViewerWidget': ('t_gui._qt.widgets.viewer_widget', 'ViewerWidget'),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attribute = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = ['LayerListWidget', 'ViewerWidget']
@@ -3,73 +3,330 @@ Qt widget for displaying and managing layers.
 """
 
 from typing import Optional, List
-try:
-    from PyQt5.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
-        QPushButton, QLabel, QSlider, QCheckBox, QMenu, QAction
-    )
-    from PyQt5.QtCore import Qt, pyqtSignal
-    from PyQt5.QtGui import QIcon
-except ImportError:
-    try:
-        from PySide2.QtWidgets import (
-            QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
-            QPushButton, QLabel, QSlider, QCheckBox, QMenu, QAction
-        )
-        from PySide2.QtCore import Qt, Signal as pyqtSignal
-        from PySide2.QtGui import QIcon
-    except ImportError:
-        raise ImportError("No Qt backend found. Please install PyQt5 or PySide2.")
+from .._qtcompat import (
+    QWidget, QVBoxLayout, QHBoxLayout, QListView,
+    QPushButton, QLabel, QMenu, QAction, QApplication, QStyle,
+    QStyledItemDelegate, QStyleOptionButton, QStyleOptionProgressBar,
+    Qt, QAbstractListModel, QEvent, QModelIndex, QRect, QSize, QTimer,
+    QIcon, pyqtSignal, pyqtSlot
+)
 
 from ...components.layer_list import LayerList
 from ...components.viewer import Layer, Viewer
+from ...settings import get_settings
+
+# Item data roles holding the Layer and opacity of a row
+LAYER_ROLE = Qt.UserRole
+OPACITY_ROLE = Qt.UserRole + 1
 
 
-class LayerItemWidget(QWidget):
-    """Widget for displaying a single layer item."""
+class LayerListModel(QAbstractListModel):
+    """
+    List model over the layers of a LayerList.
     
-    visibility_changed = pyqtSignal(bool)
-    opacity_changed = pyqtSignal(float)
+    Rows show the layers top layer first. Layer list events are
+    translated into row insertions, removals and moves, so views update
+    only the affected rows.
+    """
     
-    def __init__(self, layer: Layer, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.layer = layer
-        self._setup_ui()
-        self._connect_signals()
+        self._layer_list: Optional[LayerList] = None
+        self._connections = []  # (event type, connection token)
+        # Layer order as last announced to views. Layer list events arrive
+        # after the change, while Qt still needs the old rows between
+        # begin*Rows and end*Rows.
+        self._layers: List[Layer] = []
     
-    def _setup_ui(self):
-        """Setup the user interface."""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 2, 5, 2)
+    def set_layer_list(self, layer_list: Optional[LayerList]):
+        """
+        Set the layer list to model.
         
-        # Visibility checkbox
-        self.visibility_checkbox = QCheckBox()
-        self.visibility_checkbox.setChecked(self.layer.visible)
-        layout.addWidget(self.visibility_checkbox)
+        Parameters
+        ----------
+        layer_list : LayerList or None
+            The layer list to model.
+        """
+        if layer_list is self._layer_list:
+            return
+        
+        if self._layer_list:
+            for event_type, token in self._connections:
+                self._layer_list.disconnect(event_type, token)
+            self._connections = []
         
-        # Layer name label
-        self.name_label = QLabel(self.layer.name)
-        layout.addWidget(self.name_label, 1)
+        self._layer_list = layer_list
+        self._reset()
         
-        # Opacity slider
-        self.opacity_slider = QSlider(Qt.Horizontal)
-        self.opacity_slider.setRange(0, 100)
-        self.opacity_slider.setValue(int(self.layer.opacity * 100))
-        self.opacity_slider.setMaximumWidth(80)
-        layout.addWidget(self.opacity_slider)
-    
-    def _connect_signals(self):
-        """Connect widget signals."""
-        self.visibility_checkbox.toggled.connect(self.visibility_changed)
-        self.opacity_slider.valueChanged.connect(
-            lambda value: self.opacity_changed.emit(value / 100.0)
+        if self._layer_list:
+            self._connections = [
+                (event_type, self._layer_list.connect(event_type, callback))
+                for event_type, callback in (
+                    ('viewer_changed', self._on_layers_changed),
+                    ('layer_added', self._on_layer_added),
+                    ('layer_removed', self._on_layer_removed),
+                    ('layer_moved', self._on_layer_moved),
+                    ('layers_changed', self._on_layers_changed),
+                    ('layer_visibility_changed', self._on_layer_property_changed),
+                    ('layer_opacity_changed', self._on_layer_property_changed),
+                )
+            ]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of rows."""
+        return 0 if parent.isValid() else len(self._layers)
+    
+    def layer_at(self, row: int) -> Optional[Layer]:
+        """Get the layer shown at a row."""
+        if 0 <= row < len(self._layers):
+            return self._layers[len(self._layers) - 1 - row]
+        return None
+    
+    def row_of(self, layer: Layer) -> int:
+        """Get the row showing a layer, or -1."""
+        # One pass comparing by identity, without Layer.__eq__
+        for index, candidate in enumerate(self._layers):
+            if candidate is layer:
+                return self._row(index)
+        return -1
+    
+    def _row(self, index: int) -> int:
+        """Get the row of a layer index."""
+        return len(self._layers) - 1 - index
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the data of a row."""
+        layer = self.layer_at(index.row()) if index.isValid() else None
+        if layer is None:
+            return None
+        if role == Qt.DisplayRole:
+            return layer.name
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if layer.visible else Qt.Unchecked
+        if role == OPACITY_ROLE:
+            return layer.opacity
+        if role == LAYER_ROLE:
+            return layer
+        return None
+    
+    def flags(self, index):
+        """Get the item flags of a row."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def _reset(self):
+        """Reload every row from the layer list."""
+        self.beginResetModel()
+        self._layers = list(self._layer_list.layers) if self._layer_list else []
+        self.endResetModel()
+    
+    def _on_layer_added(self, event):
+        """Insert the row of an added layer."""
+        index = event.data.get('index')
+        if index is None:
+            self._reset()
+            return
+        # Inserting at layer index i puts the row below the current row i - 1
+        row = len(self._layers) - index
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._layers.insert(index, event.data['layer'])
+        self.endInsertRows()
+    
+    def _on_layer_removed(self, event):
+        """Remove the row of a removed layer."""
+        index = event.data.get('index')
+        if index is None:
+            self._reset()
+            return
+        row = self._row(index)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._layers[index]
+        self.endRemoveRows()
+    
+    def _on_layer_moved(self, event):
+        """Move the row of a moved layer."""
+        from_index = event.data.get('from_index')
+        if from_index is None:
+            self._reset()
+            return
+        from_row = self._row(from_index)
+        to_row = self._row(event.data['index'])
+        # Qt expects the destination as the row to insert before
+        dest = to_row + 1 if to_row > from_row else to_row
+        if self.beginMoveRows(QModelIndex(), from_row, from_row, QModelIndex(), dest):
+            self._layers.insert(event.data['index'], self._layers.pop(from_index))
+            self.endMoveRows()
+    
+    def _on_layers_changed(self, event):
+        """Reload the rows after a batched change or a viewer switch."""
+        self._reset()
+    
+    def _on_layer_property_changed(self, event):
+        """Refresh the row of a layer whose visibility or opacity changed."""
+        row = self.row_of(event.data['layer'])
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class LayerItemDelegate(QStyledItemDelegate):
+    """
+    Delegate painting a layer row: visibility box, name and opacity bar.
+    
+    Rows are drawn straight onto the view's viewport, so the list holds
+    no child widgets per layer. Clicks on the box toggle visibility and
+    clicking or dragging on the bar sets the opacity.
+    """
+    
+    visibility_toggled = pyqtSignal(object, bool)  # Layer, visible
+    opacity_changed = pyqtSignal(object, float)  # Layer, opacity
+    
+    MARGIN = 5
+    MIN_ROW_HEIGHT = 24
+    OPACITY_WIDTH = 80
+    # Minimum interval between opacity updates while dragging (~one frame)
+    OPACITY_INTERVAL_MS = 16
+    
+    def __init__(self, view):
+        super().__init__(view)
+        self._drag_layer: Optional[Layer] = None
+        self._drag_rect = QRect()
+        self._pending_opacity: Optional[float] = None
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(self.OPACITY_INTERVAL_MS)
+        self._opacity_timer.timeout.connect(self._flush_opacity)
+        # Views only pass presses and releases to editorEvent; drags on
+        # the opacity bar are followed through the viewport's moves
+        view.viewport().installEventFilter(self)
+    
+    def _rects(self, option):
+        """Get the checkbox, name and opacity rects of a row."""
+        style = option.widget.style() if option.widget else QApplication.style()
+        rect = option.rect.adjusted(self.MARGIN, 2, -self.MARGIN, -2)
+        size = style.pixelMetric(QStyle.PM_IndicatorWidth, None, option.widget)
+        
+        check_rect = QRect(rect.left(), rect.center().y() - size // 2, size, size)
+        opacity_rect = QRect(
+            rect.right() - self.OPACITY_WIDTH + 1, rect.center().y() - 4,
+            self.OPACITY_WIDTH, 8
+        )
+        name_rect = QRect(
+            check_rect.right() + self.MARGIN + 1, rect.top(),
+            opacity_rect.left() - check_rect.right() - 2 * self.MARGIN - 1, rect.height()
         )
+        return check_rect, name_rect, opacity_rect
+    
+    def paint(self, painter, option, index):
+        """Paint a layer row."""
+        layer = index.data(LAYER_ROLE)
+        if layer is None:
+            super().paint(painter, option, index)
+            return
+        
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        check_rect, name_rect, opacity_rect = self._rects(option)
+        
+        # Selection / hover background
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+        
+        check = QStyleOptionButton()
+        check.rect = check_rect
+        check.state = QStyle.State_Enabled | (QStyle.State_On if layer.visible else QStyle.State_Off)
+        style.drawPrimitive(QStyle.PE_IndicatorCheckBox, check, painter, widget)
+        
+        selected = bool(option.state & QStyle.State_Selected)
+        painter.save()
+        painter.setPen(option.palette.color(
+            option.palette.HighlightedText if selected else option.palette.Text
+        ))
+        text = option.fontMetrics.elidedText(layer.name, Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignVCenter | Qt.AlignLeft, text)
+        painter.restore()
+        
+        bar = QStyleOptionProgressBar()
+        bar.rect = opacity_rect
+        bar.state = QStyle.State_Enabled | QStyle.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = int(round(layer.opacity * 100))
+        bar.textVisible = False
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter, widget)
+    
+    def sizeHint(self, option, index):
+        """Get the size of a layer row (the same for every row)."""
+        height = max(option.fontMetrics.height() + 8, self.MIN_ROW_HEIGHT)
+        return QSize(self.OPACITY_WIDTH * 2, height)
     
-    def update_layer(self):
-        """Update widget to reflect layer state."""
-        self.visibility_checkbox.setChecked(self.layer.visible)
-        self.opacity_slider.setValue(int(self.layer.opacity * 100))
-        self.name_label.setText(self.layer.name)
+    def editorEvent(self, event, model, option, index):
+        """Handle clicks on the visibility box and opacity bar."""
+        layer = index.data(LAYER_ROLE)
+        etype = event.type()
+        if layer is None or etype not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        
+        check_rect, _, opacity_rect = self._rects(option)
+        pos = event.pos()
+        
+        if etype == QEvent.MouseButtonRelease:
+            if self._drag_layer is not None:
+                self._flush_opacity()
+                self._drag_layer = None
+                return True
+            if event.button() == Qt.LeftButton and check_rect.contains(pos):
+                self.visibility_toggled.emit(layer, not layer.visible)
+                return True
+            return False
+        
+        if event.button() != Qt.LeftButton:
+            return False
+        if check_rect.contains(pos):
+            return True
+        if not opacity_rect.contains(pos):
+            return False
+        
+        self._drag_layer = layer
+        self._drag_rect = opacity_rect
+        self._set_drag_opacity(pos.x())
+        return True
+    
+    def eventFilter(self, obj, event):
+        """Follow a drag on an opacity bar."""
+        if self._drag_layer is not None and event.type() == QEvent.MouseMove:
+            if event.buttons() & Qt.LeftButton:
+                self._set_drag_opacity(event.pos().x())
+                return True
+            self._flush_opacity()
+            self._drag_layer = None
+        return super().eventFilter(obj, event)
+    
+    def _set_drag_opacity(self, x: int):
+        """Queue the opacity for a position on the dragged bar."""
+        rect = self._drag_rect
+        self._pending_opacity = max(0.0, min(1.0, (x - rect.left()) / max(rect.width() - 1, 1)))
+        # Trailing throttle: emit at most once per interval, latest value wins
+        if not self._opacity_timer.isActive():
+            self._opacity_timer.start()
+    
+    @property
+    def drag_layer(self) -> Optional[Layer]:
+        """Get the layer whose opacity bar is being dragged, if any."""
+        return self._drag_layer
+    
+    def cancel_drag(self):
+        """Abandon an opacity drag without emitting its queued value."""
+        self._opacity_timer.stop()
+        self._pending_opacity = None
+        self._drag_layer = None
+    
+    def _flush_opacity(self):
+        """Emit the queued opacity of the dragged layer."""
+        self._opacity_timer.stop()
+        opacity, self._pending_opacity = self._pending_opacity, None
+        if opacity is not None and self._drag_layer is not None:
+            self.opacity_changed.emit(self._drag_layer, opacity)
 
 
 class LayerListWidget(QWidget):
@@ -83,7 +340,8 @@ class LayerListWidget(QWidget):
     def __init__(self, layer_list: Optional[LayerList] = None, parent=None):
         super().__init__(parent)
         self._layer_list: Optional[LayerList] = None
-        self._layer_widgets = {}  # Map layer to widget
+        self._selection_token = None
+        self.model = LayerListModel(self)
         
         self._setup_ui()
         self._setup_actions()
@@ -98,7 +356,7 @@ class LayerListWidget(QWidget):
         # Header
         header_layout = QHBoxLayout()
         header_label = QLabel("Layers")
-        header_label.setStyleSheet("font-weight: bold;")
+        header_label.setObjectName("tg-header")
         header_layout.addWidget(header_label)
         header_layout.addStretch()
         
@@ -114,15 +372,32 @@ class LayerListWidget(QWidget):
         layout.addLayout(header_layout)
         
         # Layer list
-        self.list_widget = QListWidget()
-        self.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        layout.addWidget(self.list_widget)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        # Rows share one size hint, so the view can skip per-row layout;
+        # configurable in case it misbehaves on a platform
+        self.list_view.setUniformItemSizes(
+            bool(get_settings().get('performance.uniform_row_heights', True))
+        )
+        self.delegate = LayerItemDelegate(self.list_view)
+        self.list_view.setItemDelegate(self.delegate)
+        layout.addWidget(self.list_view)
         
         # Connect signals
-        self.list_widget.itemSelectionChanged.connect(self._on_selection_changed)
-        self.list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.list_widget.customContextMenuRequested.connect(self._show_context_menu)
+        self.list_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.list_view.doubleClicked.connect(self._on_item_double_clicked)
+        self.list_view.customContextMenuRequested.connect(self._show_context_menu)
         self.remove_button.clicked.connect(self._remove_selected_layers)
+        # The delegate always emits from the GUI thread
+        self.delegate.visibility_toggled.connect(
+            self._on_layer_visibility_changed, Qt.DirectConnection
+        )
+        self.delegate.opacity_changed.connect(
+            self._on_layer_opacity_changed, Qt.DirectConnection
+        )
+        self.model.rowsRemoved.connect(self._on_rows_removed)
+        self.model.modelReset.connect(self._on_rows_removed)
     
     def _setup_actions(self):
         """Setup context menu actions."""
@@ -147,102 +422,62 @@ class LayerListWidget(QWidget):
         layer_list : LayerList or None
             The layer list to display.
         """
+        if layer_list is self._layer_list:
+            return
+        
         if self._layer_list:
             # Disconnect from old layer list
-            self._layer_list.disconnect('layer_added', self._on_layer_added)
-            self._layer_list.disconnect('layer_removed', self._on_layer_removed)
-            self._layer_list.disconnect('layer_moved', self._on_layer_moved)
-            self._layer_list.disconnect('selection_changed', self._on_layer_selection_changed)
+            self._layer_list.disconnect('selection_changed', self._selection_token)
         
         self._layer_list = layer_list
-        self._refresh_list()
+        self.model.set_layer_list(layer_list)
         
         if self._layer_list:
             # Connect to new layer list
-            self._layer_list.connect('layer_added', self._on_layer_added)
-            self._layer_list.connect('layer_removed', self._on_layer_removed)
-            self._layer_list.connect('layer_moved', self._on_layer_moved)
-            self._layer_list.connect('selection_changed', self._on_layer_selection_changed)
-    
-    def _refresh_list(self):
-        """Refresh the entire layer list."""
-        self.list_widget.clear()
-        self._layer_widgets.clear()
-        
-        if self._layer_list:
-            for layer in reversed(self._layer_list.layers):  # Reverse for top-to-bottom display
-                self._add_layer_item(layer)
-    
-    def _add_layer_item(self, layer: Layer):
-        """Add a layer item to the list."""
-        item = QListWidgetItem()
-        widget = LayerItemWidget(layer)
-        
-        # Connect layer widget signals
-        widget.visibility_changed.connect(
-            lambda visible: self._on_layer_visibility_changed(layer, visible)
-        )
-        widget.opacity_changed.connect(
-            lambda opacity: self._on_layer_opacity_changed(layer, opacity)
-        )
-        
-        item.setSizeHint(widget.sizeHint())
-        self.list_widget.addItem(item)
-        self.list_widget.setItemWidget(item, widget)
-        
-        self._layer_widgets[layer] = (item, widget)
-    
-    def _remove_layer_item(self, layer: Layer):
-        """Remove a layer item from the list."""
-        if layer in self._layer_widgets:
-            item, widget = self._layer_widgets[layer]
-            row = self.list_widget.row(item)
-            self.list_widget.takeItem(row)
-            del self._layer_widgets[layer]
-    
-    def _on_layer_added(self, event):
-        """Handle layer added event."""
-        layer = event.data['layer']
-        self._add_layer_item(layer)
-    
-    def _on_layer_removed(self, event):
-        """Handle layer removed event."""
-        layer = event.data['layer']
-        self._remove_layer_item(layer)
+            self._selection_token = self._layer_list.connect(
+                'selection_changed', self._on_layer_selection_changed
+            )
     
-    def _on_layer_moved(self, event):
-        """Handle layer moved event."""
-        # For simplicity, refresh the entire list
-        self._refresh_list()
+    def _on_rows_removed(self, *args):
+        """Drop the delegate's reference to a removed layer being dragged."""
+        layer = self.delegate.drag_layer
+        if layer is not None and self.model.row_of(layer) < 0:
+            self.delegate.cancel_drag()
     
     def _on_layer_selection_changed(self, event):
         """Handle layer selection changed event."""
-        # Update list widget selection to match layer list selection
+        # Update list view selection to match layer list selection
         pass
     
-    def _on_selection_changed(self):
-        """Handle list widget selection change."""
-        selected_items = self.list_widget.selectedItems()
-        if selected_items and self._layer_list:
-            # Find the layer corresponding to the selected item
-            for layer, (item, widget) in self._layer_widgets.items():
-                if item in selected_items:
-                    self._layer_list.select_layer(layer)
-                    self.layer_selected.emit(layer)
-                    break
-    
-    def _on_item_double_clicked(self, item):
+    def _selected_layer(self) -> Optional[Layer]:
+        """Get the layer of the selected row."""
+        indexes = self.list_view.selectionModel().selectedIndexes()
+        if indexes:
+            return self.model.layer_at(indexes[0].row())
+        return None
+    
+    def _on_selection_changed(self, selected=None, deselected=None):
+        """Handle list view selection change."""
+        layer = self._selected_layer()
+        if layer is not None and self._layer_list:
+            self._layer_list.select_layer(layer)
+            self.layer_selected.emit(layer)
+    
+    def _on_item_double_clicked(self, index):
         """Handle item double click."""
-        for layer, (layer_item, widget) in self._layer_widgets.items():
-            if layer_item is item:
-                self.layer_double_clicked.emit(layer)
-                break
+        layer = self.model.layer_at(index.row())
+        if layer is not None:
+            self.layer_double_clicked.emit(layer)
     
+    # Typed slots matching the delegate's signals, so Qt connects them
+    # by signature instead of through a Python proxy slot
+    @pyqtSlot(object, bool)
     def _on_layer_visibility_changed(self, layer: Layer, visible: bool):
         """Handle layer visibility change."""
-        if self._layer_list:
+        if self._layer_list and layer.visible != visible:
             self._layer_list.toggle_layer_visibility(layer)
     
+    @pyqtSlot(object, float)
     def _on_layer_opacity_changed(self, layer: Layer, opacity: float):
         """Handle layer opacity change."""
         if self._layer_list:
@@ -250,15 +485,14 @@ class LayerListWidget(QWidget):
     
     def _show_context_menu(self, position):
         """Show context menu."""
-        item = self.list_widget.itemAt(position)
-        if item:
+        if self.list_view.indexAt(position).isValid():
             menu = QMenu(self)
             menu.addAction(self.move_up_action)
             menu.addAction(self.move_down_action)
             menu.addSeparator()
             menu.addAction(self.duplicate_action)
             menu.addAction(self.delete_action)
-            menu.exec_(self.list_widget.mapToGlobal(position))
+            menu.exec_(self.list_view.mapToGlobal(position))
     
     def _remove_selected_layers(self):
         """Remove selected layers."""
@@ -267,21 +501,15 @@ class LayerListWidget(QWidget):
     
     def _move_layer_up(self):
         """Move selected layer up."""
-        selected_items = self.list_widget.selectedItems()
-        if selected_items and self._layer_list:
-            for layer, (item, widget) in self._layer_widgets.items():
-                if item in selected_items:
-                    self._layer_list.move_layer_up(layer)
-                    break
+        layer = self._selected_layer()
+        if layer is not None and self._layer_list:
+            self._layer_list.move_layer_up(layer)
     
     def _move_layer_down(self):
         """Move selected layer down."""
-        selected_items = self.list_widget.selectedItems()
-        if selected_items and self._layer_list:
-            for layer, (item, widget) in self._layer_widgets.items():
-                if item in selected_items:
-                    self._layer_list.move_layer_down(layer)
-                    break
+        layer = self._selected_layer()
+        if layer is not None and self._layer_list:
+            self._layer_list.move_layer_down(layer)
     
     def _duplicate_layer(self):
         """Duplicate selected layer."""
@@ -2,22 +2,73 @@
 Qt widget for the main viewer display.
 """
 
-from typing import Optional
-try:
-    from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-    from PyQt5.QtCore import Qt, pyqtSignal
-    from PyQt5.QtGui import QPainter, QColor, QFont
-except ImportError:
-    try:
-        from PySide2.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-        from PySide2.QtCore import Qt, Signal as pyqtSignal
-        from PySide2.QtGui import QPainter, QColor, QFont
-    except ImportError:
-        raise ImportError("No Qt backend found. Please install PyQt5 or PySide2.")
+from typing import Optional, Tuple
+from .._qtcompat import (
+    QWidget, QVBoxLayout, QLabel, QFrame, Qt, QRect, QTimer, QPainter, QColor, QFont,
+    QBrush, QObject, pyqtSignal, pyqtSlot
+)
 
 from ...components.viewer import Viewer, Layer
 
 
+class ViewerBridge(QObject):
+    """
+    Re-emit a viewer's layer events as Qt signals.
+    
+    The bridge is the viewer's only Python subscriber for the canvas;
+    widgets connect to its signals, which Qt dispatches directly.
+    """
+    
+    layers_changed = pyqtSignal()
+    active_layer_changed = pyqtSignal(object)  # Layer or None
+    
+    # Viewer events that change the layer list
+    _LAYER_EVENTS = ('layer_added', 'layer_removed', 'layer_moved', 'layers_changed')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._viewer: Optional[Viewer] = None
+        # (event_type, token) pairs for the connected viewer
+        self._connections = []
+    
+    def set_viewer(self, viewer: Optional[Viewer]):
+        """
+        Set the viewer whose events are re-emitted.
+        
+        Parameters
+        ----------
+        viewer : Viewer or None
+            The viewer to listen to.
+        """
+        if self._viewer:
+            for event_type, token in self._connections:
+                self._viewer.disconnect(event_type, token)
+            self._connections.clear()
+        
+        self._viewer = viewer
+        
+        if self._viewer:
+            for event_type in self._LAYER_EVENTS:
+                self._connections.append(
+                    (event_type, viewer.connect(event_type, self._on_layers_changed))
+                )
+            self._connections.append(
+                ('active_layer_changed',
+                 viewer.connect('active_layer_changed', self._on_active_layer_changed))
+            )
+    
+    def _on_layers_changed(self, event):
+        """Forward a layer list change."""
+        self.layers_changed.emit()
+        if event.data.get('active'):
+            # An added layer that became active
+            self.active_layer_changed.emit(event.data['layer'])
+    
+    def _on_active_layer_changed(self, event):
+        """Forward an active layer change."""
+        self.active_layer_changed.emit(event.data['layer'])
+
+
 class ViewerCanvas(QWidget):
     """
     Canvas widget for displaying viewer content.
@@ -28,12 +79,57 @@ class ViewerCanvas(QWidget):
     
     layer_clicked = pyqtSignal(object)  # Layer
     
+    # Paint resources, shared by all canvases; built by the first canvas,
+    # after the application exists, instead of at import time
+    _BG: Optional[QColor] = None
+    _PLACEHOLDER: Optional[QColor] = None
+    _ACTIVE: Optional[QColor] = None
+    _INACTIVE: Optional[QColor] = None
+    _FONT_PLACEHOLDER: Optional[QFont] = None
+    _FONT_ROW: Optional[QFont] = None
+    # Opacity bar brushes, indexed by alpha (0-255)
+    _OPACITY_BRUSHES: Tuple[QBrush, ...] = ()
+    
+    @classmethod
+    def _init_paint_resources(cls):
+        """Create the shared paint resources."""
+        cls._BG = QColor(43, 43, 43)
+        cls._PLACEHOLDER = QColor(150, 150, 150)
+        cls._ACTIVE = QColor(100, 150, 255)
+        cls._INACTIVE = QColor(200, 200, 200)
+        cls._FONT_PLACEHOLDER = QFont("Arial", 12)
+        cls._FONT_ROW = QFont("Arial", 10)
+        cls._OPACITY_BRUSHES = tuple(
+            QBrush(QColor(100, 150, 255, alpha)) for alpha in range(256)
+        )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        if not ViewerCanvas._OPACITY_BRUSHES:
+            ViewerCanvas._init_paint_resources()
         self.setMinimumSize(400, 300)
-        self.setStyleSheet("background-color: #2b2b2b; border: 1px solid #555;")
+        self.setObjectName("tg-viewer-canvas")
+        # paintEvent fills its whole dirty rect, so skip Qt's erase
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self._viewer: Optional[Viewer] = None
-        self._layers_info = []
+        # Layer fields read by paintEvent, as parallel sequences in layer order
+        self._layer_refs = ()
+        self._names = []
+        self._types = []
+        self._visible = []
+        self._opacity = []
+        self._active_mask = []
+        
+        # Layer events only schedule a refresh, so a burst of them
+        # rebuilds and repaints once when control returns to the loop
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
+        self._bridge = ViewerBridge(self)
+        self._bridge.layers_changed.connect(self._on_layer_changed)
+        self._bridge.active_layer_changed.connect(self._on_active_layer_changed)
     
     def set_viewer(self, viewer: Optional[Viewer]):
         """
@@ -44,75 +140,96 @@ class ViewerCanvas(QWidget):
         viewer : Viewer or None
             The viewer to display.
         """
-        if self._viewer:
-            # Disconnect from old viewer
-            self._viewer.disconnect('layer_added', self._on_layer_changed)
-            self._viewer.disconnect('layer_removed', self._on_layer_changed)
-            self._viewer.disconnect('active_layer_changed', self._on_active_layer_changed)
-        
         self._viewer = viewer
-        
-        if self._viewer:
-            # Connect to new viewer
-            self._viewer.connect('layer_added', self._on_layer_changed)
-            self._viewer.connect('layer_removed', self._on_layer_changed)
-            self._viewer.connect('active_layer_changed', self._on_active_layer_changed)
+        self._bridge.set_viewer(viewer)
         
         self._update_layers_info()
         self.update()
     
-    def _update_layers_info(self):
-        """Update the layers information for display."""
-        self._layers_info = []
-        if self._viewer:
-            for i, layer in enumerate(self._viewer.layers):
-                info = {
-                    'layer': layer,
-                    'name': layer.name,
-                    'type': type(layer).__name__,
-                    'visible': layer.visible,
-                    'opacity': layer.opacity,
-                    'is_active': layer is self._viewer.active_layer
-                }
-                self._layers_info.append(info)
+    def _update_layers_info(self) -> bool:
+        """
+        Update the layers information for display.
+        
+        Returns
+        -------
+        bool
+            Whether anything drawn on the canvas changed.
+        """
+        layers = self._viewer.layers if self._viewer else ()
+        active = self._viewer.active_layer if self._viewer else None
+        
+        fields = (
+            layers,
+            [layer.name for layer in layers],
+            [layer.type_name for layer in layers],
+            [layer.visible for layer in layers],
+            [layer.opacity for layer in layers],
+            [layer is active for layer in layers],
+        )
+        old_fields = (
+            self._layer_refs, self._names, self._types,
+            self._visible, self._opacity, self._active_mask,
+        )
+        if fields == old_fields:
+            return False
+        
+        (self._layer_refs, self._names, self._types,
+         self._visible, self._opacity, self._active_mask) = fields
+        return True
     
     def paintEvent(self, event):
-        """Paint the canvas."""
+        """Paint the canvas, drawing only rows inside the dirty region."""
+        region = event.region()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Only axis-aligned text and rects are drawn; shape antialiasing
+        # would just slow the raster fills
+        painter.setRenderHint(QPainter.TextAntialiasing)
         
         # Fill background
-        painter.fillRect(self.rect(), QColor(43, 43, 43))
+        painter.fillRect(event.rect(), self._BG)
         
-        if not self._viewer or not self._layers_info:
+        if not self._viewer or not self._layer_refs:
             # Draw placeholder text
-            painter.setPen(QColor(150, 150, 150))
-            painter.setFont(QFont("Arial", 12))
-            painter.drawText(self.rect(), Qt.AlignCenter, "No data to display")
+            painter.setPen(self._PLACEHOLDER)
+            painter.setFont(self._FONT_PLACEHOLDER)
+            text = "No data to display"
+            text_rect = painter.fontMetrics().boundingRect(self.rect(), Qt.AlignCenter, text)
+            if region.intersects(text_rect):
+                painter.drawText(self.rect(), Qt.AlignCenter, text)
             return
         
         # Draw layer information (simplified visualization)
         y_offset = 20
-        painter.setFont(QFont("Arial", 10))
+        width = self.width()
+        painter.setFont(self._FONT_ROW)
+        
+        names, types, visible = self._names, self._types, self._visible
+        opacity, active = self._opacity, self._active_mask
+        opacity_brushes = self._OPACITY_BRUSHES
+        active_color, inactive_color = self._ACTIVE, self._INACTIVE
+        # Bound once, outside the row loop
+        intersects = region.intersects
+        set_pen, draw_text, fill_rect = painter.setPen, painter.drawText, painter.fillRect
         
-        for info in self._layers_info:
-            if not info['visible']:
+        for i in range(len(names)):
+            if not visible[i]:
+                continue
+            
+            # Rows span from the text ascent to below the opacity bar
+            if not intersects(QRect(0, y_offset - 20, width, 30)):
+                y_offset += 30
                 continue
             
             # Set color based on layer type and activity
-            if info['is_active']:
-                painter.setPen(QColor(100, 150, 255))
-            else:
-                painter.setPen(QColor(200, 200, 200))
+            set_pen(active_color if active[i] else inactive_color)
             
             # Draw layer representation
-            text = f"{info['name']} ({info['type']})"
-            painter.drawText(10, y_offset, text)
+            draw_text(10, y_offset, f"{names[i]} ({types[i]})")
             
             # Draw opacity indicator
-            opacity_width = int(100 * info['opacity'])
-            painter.fillRect(10, y_offset + 5, opacity_width, 3, 
-                           QColor(100, 150, 255, int(255 * info['opacity'])))
+            layer_opacity = opacity[i]
+            alpha = min(max(int(255 * layer_opacity), 0), 255)
+            fill_rect(10, y_offset + 5, int(100 * layer_opacity), 3, opacity_brushes[alpha])
             
             y_offset += 30
     
@@ -121,22 +238,34 @@ class ViewerCanvas(QWidget):
         if event.button() == Qt.LeftButton and self._viewer:
             # Simple layer selection based on click position
             y_pos = event.y()
-            layer_index = (y_pos - 20) // 30
+            row = (y_pos - 20) // 30
             
-            if 0 <= layer_index < len(self._layers_info):
-                layer_info = self._layers_info[layer_index]
-                self.layer_clicked.emit(layer_info['layer'])
-                self._viewer.active_layer = layer_info['layer']
+            # Rows are only drawn for visible layers
+            drawn = [layer for layer, shown in zip(self._layer_refs, self._visible) if shown]
+            if 0 <= row < len(drawn):
+                layer = drawn[row]
+                self.layer_clicked.emit(layer)
+                self._viewer.active_layer = layer
+    
+    def _schedule_refresh(self):
+        """Refresh the canvas once the current burst of events is over."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
     
-    def _on_layer_changed(self, event):
+    def _do_refresh(self):
+        """Rebuild the layers information and repaint if it changed."""
+        if self._update_layers_info():
+            self.update()
+    
+    @pyqtSlot()
+    def _on_layer_changed(self):
         """Handle layer changes."""
-        self._update_layers_info()
-        self.update()
+        self._schedule_refresh()
     
-    def _on_active_layer_changed(self, event):
+    @pyqtSlot(object)
+    def _on_active_layer_changed(self, layer):
         """Handle active layer changes."""
-        self._update_layers_info()
-        self.update()
+        self._schedule_refresh()
 
 
 class ViewerWidget(QWidget):
@@ -167,7 +296,7 @@ class ViewerWidget(QWidget):
         header_layout.setContentsMargins(5, 2, 5, 2)
         
         self.title_label = QLabel("Viewer")
-        self.title_label.setStyleSheet("font-weight: bold; color: #ddd;")
+        self.title_label.setObjectName("tg-viewer-title")
         header_layout.addWidget(self.title_label)
         
         layout.addWidget(self.header_frame)
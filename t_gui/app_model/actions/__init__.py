@@ -5,7 +5,8 @@ This module defines the action system that allows for creating reusable
 commands that can be triggered from menus, toolbars, or keyboard shortcuts.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from dataclasses import dataclass
 from ..context import get_app_context
 
@@ -62,6 +63,21 @@ class ActionManager:
         self._actions[action.id] = action
         self._context.emit('action_registered', action=action)
     
+    def register_actions(self, actions: Iterable[Action]):
+        """
+        Register several actions at once.
+        
+        Parameters
+        ----------
+        actions : iterable of Action
+            The actions to register.
+        """
+        actions = list(actions)
+        self._actions.update((action.id, action) for action in actions)
+        if self._context.has_listeners('action_registered'):
+            for action in actions:
+                self._context.emit('action_registered', action=action)
+    
     def unregister_action(self, action_id: str):
         """
         Unregister an action.
@@ -139,12 +155,16 @@ class ActionManager:
             self._context.emit('action_enabled_changed', action=action, enabled=enabled)
 
 
-# Global action manager instance
-_global_action_manager = ActionManager()
-
+# Global action manager, created on first use
+@lru_cache(maxsize=None)
 def get_action_manager() -> ActionManager:
     """Get the global action manager."""
-    return _global_action_manager
+    return ActionManager()
+
+
+def _reset_action_manager():
+    """Discard the global action manager, e.g. between tests."""
+    get_action_manager.cache_clear()
 
 
 # Decorator for registering actions
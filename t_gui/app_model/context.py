@@ -2,6 +2,7 @@
 Application context management.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from ..events import EventEmitter
 
@@ -146,9 +147,14 @@ class AppContext(EventEmitter):
         self.emit('context_cleared', old_data=old_data)
 
 
-# Global application context instance
-_global_context = AppContext()
-
+# Global application context, created on first use.
+# (lru_cache rather than functools.cache, which needs Python 3.9)
+@lru_cache(maxsize=None)
 def get_app_context() -> AppContext:
     """Get the global application context."""
-    return _global_context
+    return AppContext()
+
+
+def _reset_app_context():
+    """Discard the global application context, e.g. between tests."""
+    get_app_context.cache_clear()
@@ -2,7 +2,7 @@
 Layer list component for T-GUI.
 """
 
-from typing import List, Optional, Callable
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
 from ..events import EventEmitter
 from .viewer import Viewer, Layer
 
@@ -18,7 +18,8 @@ class LayerList(EventEmitter):
     def __init__(self, viewer: Optional[Viewer] = None):
         super().__init__()
         self._viewer: Optional[Viewer] = None
-        self._selection: List[Layer] = []
+        # Selected layers keyed by id(layer), in selection order
+        self._selection: Dict[int, Layer] = {}
         
         if viewer:
             self.set_viewer(viewer)
@@ -29,16 +30,16 @@ class LayerList(EventEmitter):
         return self._viewer
     
     @property
-    def layers(self) -> List[Layer]:
+    def layers(self) -> Tuple[Layer, ...]:
         """Get all layers from the viewer."""
         if self._viewer:
             return self._viewer.layers
-        return []
+        return ()
     
     @property
     def selection(self) -> List[Layer]:
         """Get the currently selected layers."""
-        return self._selection.copy()
+        return list(self._selection.values())
     
     def set_viewer(self, viewer: Optional[Viewer]):
         """
@@ -54,6 +55,7 @@ class LayerList(EventEmitter):
             self._viewer.disconnect('layer_added', self._on_layer_added)
             self._viewer.disconnect('layer_removed', self._on_layer_removed)
             self._viewer.disconnect('layer_moved', self._on_layer_moved)
+            self._viewer.disconnect('layers_changed', self._on_layers_changed)
             self._viewer.disconnect('active_layer_changed', self._on_active_layer_changed)
         
         self._viewer = viewer
@@ -64,6 +66,7 @@ class LayerList(EventEmitter):
             self._viewer.connect('layer_added', self._on_layer_added)
             self._viewer.connect('layer_removed', self._on_layer_removed)
             self._viewer.connect('layer_moved', self._on_layer_moved)
+            self._viewer.connect('layers_changed', self._on_layers_changed)
             self._viewer.connect('active_layer_changed', self._on_active_layer_changed)
         
         self.emit('viewer_changed', viewer=viewer)
@@ -80,11 +83,11 @@ class LayerList(EventEmitter):
             Whether to extend the current selection. Default is False.
         """
         if not extend:
-            self._selection.clear()
-        
-        if layer not in self._selection and layer in self.layers:
-            self._selection.append(layer)
-            self.emit('selection_changed', selection=self._selection)
+            self.set_selection([layer])
+        elif (id(layer) not in self._selection and self._viewer is not None
+                and self._viewer.contains(layer)):
+            self._selection[id(layer)] = layer
+            self.emit('selection_changed', selection=self.selection, added=[layer], removed=[])
     
     def deselect_layer(self, layer: Layer):
         """
@@ -95,20 +98,43 @@ class LayerList(EventEmitter):
         layer : Layer
             The layer to deselect.
         """
-        if layer in self._selection:
-            self._selection.remove(layer)
-            self.emit('selection_changed', selection=self._selection)
+        if self._selection.pop(id(layer), None) is not None:
+            self.emit('selection_changed', selection=self.selection, added=[], removed=[layer])
+    
+    def set_selection(self, layers: Iterable[Layer]):
+        """
+        Replace the selection.
+        
+        Layers that are not in the viewer are ignored. A single
+        ``selection_changed`` event is emitted, with the ``added`` and
+        ``removed`` layers, if the selection changed.
+        
+        Parameters
+        ----------
+        layers : iterable of Layer
+            The layers to select, in selection order.
+        """
+        viewer = self._viewer
+        new = {
+            id(layer): layer for layer in layers
+            if viewer is not None and viewer.contains(layer)
+        }
+        old = self._selection
+        if list(new) == list(old):
+            return
+        
+        added = [layer for key, layer in new.items() if key not in old]
+        removed = [layer for key, layer in old.items() if key not in new]
+        self._selection = new
+        self.emit('selection_changed', selection=self.selection, added=added, removed=removed)
     
     def clear_selection(self):
         """Clear the layer selection."""
-        if self._selection:
-            self._selection.clear()
-            self.emit('selection_changed', selection=self._selection)
+        self.set_selection(())
     
     def select_all(self):
         """Select all layers."""
-        self._selection = self.layers.copy()
-        self.emit('selection_changed', selection=self._selection)
+        self.set_selection(self.layers)
     
     def is_selected(self, layer: Layer) -> bool:
         """
@@ -124,7 +150,7 @@ class LayerList(EventEmitter):
         bool
             True if the layer is selected.
         """
-        return layer in self._selection
+        return id(layer) in self._selection
     
     def move_layer_up(self, layer: Layer):
         """
@@ -135,9 +161,8 @@ class LayerList(EventEmitter):
         layer : Layer
             The layer to move up.
         """
-        if self._viewer and layer in self._viewer.layers:
-            layers = self._viewer.layers
-            current_index = layers.index(layer)
+        if self._viewer:
+            current_index = self._viewer.index_of(layer)
             if current_index > 0:
                 self._viewer.move_layer(layer, current_index - 1)
     
@@ -150,16 +175,15 @@ class LayerList(EventEmitter):
         layer : Layer
             The layer to move down.
         """
-        if self._viewer and layer in self._viewer.layers:
-            layers = self._viewer.layers
-            current_index = layers.index(layer)
-            if current_index < len(layers) - 1:
+        if self._viewer:
+            current_index = self._viewer.index_of(layer)
+            if 0 <= current_index < len(self._viewer.layers) - 1:
                 self._viewer.move_layer(layer, current_index + 1)
     
     def delete_selected_layers(self):
         """Delete all selected layers."""
         if self._viewer:
-            for layer in self._selection.copy():
+            for layer in self.selection:
                 self._viewer.remove_layer(layer)
     
     def toggle_layer_visibility(self, layer: Layer):
@@ -190,18 +214,33 @@ class LayerList(EventEmitter):
     
     def _on_layer_added(self, event):
         """Handle layer added event from viewer."""
-        self.emit('layer_added', layer=event.data['layer'])
+        layer = event.data['layer']
+        self.emit('layer_added', layer=layer, index=event.data.get('index'))
+        if event.data.get('active'):
+            # The viewer folds the active layer change into layer_added
+            self.emit('active_layer_changed', layer=layer, old_layer=event.data.get('old_active'))
     
     def _on_layer_removed(self, event):
         """Handle layer removed event from viewer."""
         layer = event.data['layer']
-        if layer in self._selection:
-            self._selection.remove(layer)
-        self.emit('layer_removed', layer=layer)
+        self._selection.pop(id(layer), None)
+        self.emit('layer_removed', layer=layer, index=event.data.get('index'))
     
     def _on_layer_moved(self, event):
         """Handle layer moved event from viewer."""
-        self.emit('layer_moved', layer=event.data['layer'], index=event.data['index'])
+        self.emit(
+            'layer_moved',
+            layer=event.data['layer'],
+            index=event.data['index'],
+            from_index=event.data.get('from_index'),
+        )
+    
+    def _on_layers_changed(self, event):
+        """Handle a batched layer change from viewer."""
+        removed = event.data['removed']
+        for layer in removed:
+            self._selection.pop(id(layer), None)
+        self.emit('layers_changed', added=event.data['added'], removed=removed)
     
     def _on_active_layer_changed(self, event):
         """Handle active layer changed event from viewer."""
@@ -2,11 +2,29 @@
 Main viewer component for T-GUI.
 """
 
-from typing import Any, Dict, List, Optional
+import weakref
+from contextlib import contextmanager
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+import numpy as np
 from ..events import EventEmitter
 from ..app_model.context import get_app_context
 
 
+def _prepare_image_data(data: Any) -> Any:
+    """
+    Normalize image data at the viewer boundary.
+    
+    Floating-point NumPy arrays are stored as C-contiguous float32, the
+    layout used for texture uploads. Arrays already in that layout are
+    kept as-is without a copy; any other data is passed through unchanged.
+    """
+    if (isinstance(data, np.ndarray) and data.dtype.kind == 'f'
+            and not (data.dtype == np.float32 and data.flags.c_contiguous)):
+        return np.ascontiguousarray(data, dtype=np.float32)
+    # Returned unchanged, so subclasses such as SharedArray are kept
+    return data
+
+
 class Layer:
     """
     Base class for layers in the viewer.
@@ -21,15 +39,44 @@ class Layer:
         Whether the layer is visible.
     opacity : float
         Layer opacity (0.0 to 1.0).
+    type_name : str
+        Class name of the layer type, for display.
     """
     
+    type_name: ClassVar[str] = "Layer"
+    
+    # No per-instance __dict__; subclasses declare their own attributes
+    __slots__ = ('data', '_viewers', '_name', 'visible', 'opacity', '_metadata', '__weakref__')
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'type_name' not in cls.__dict__:
+            cls.type_name = cls.__name__
+    
     def __init__(self, data: Any, name: str = None, visible: bool = True, opacity: float = 1.0):
         self.data = data
-        self.name = name or "Layer"
+        # Viewers holding this layer, told about renames; held weakly so
+        # that a layer does not keep a closed viewer alive
+        self._viewers: 'weakref.WeakSet[Viewer]' = weakref.WeakSet()
+        self._name = name or "Layer"
         self.visible = visible
         self.opacity = opacity
         self._metadata = {}
     
+    @property
+    def name(self) -> str:
+        """Get the layer name."""
+        return self._name
+    
+    @name.setter
+    def name(self, name: str):
+        """Set the layer name."""
+        old_name = self._name
+        if name != old_name:
+            self._name = name
+            for viewer in self._viewers:
+                viewer._on_layer_renamed(self, old_name)
+    
     @property
     def metadata(self) -> Dict[str, Any]:
         """Get layer metadata."""
@@ -47,6 +94,10 @@ class Layer:
 class ImageLayer(Layer):
     """Layer for displaying image data."""
 
+    type_name: ClassVar[str] = "ImageLayer"
+
+    __slots__ = ('colormap', 'contrast_limits')
+
     def __init__(self, data: Any, **kwargs):
         # Extract image-specific kwargs before passing to parent
         self.colormap = kwargs.pop('colormap', 'gray')
@@ -57,6 +108,10 @@ class ImageLayer(Layer):
 class PointsLayer(Layer):
     """Layer for displaying point data."""
 
+    type_name: ClassVar[str] = "PointsLayer"
+
+    __slots__ = ('size', 'edge_color', 'face_color')
+
     def __init__(self, data: Any, **kwargs):
         # Extract points-specific kwargs before passing to parent
         self.size = kwargs.pop('size', 10)
@@ -77,17 +132,62 @@ class Viewer(EventEmitter):
         super().__init__()
         self.title = title
         self._layers: List[Layer] = []
+        # Read-only copy of self._layers, rebuilt on first access after a change
+        self._layers_tuple: Optional[Tuple[Layer, ...]] = ()
+        # Position of each layer in self._layers, keyed by id(layer)
+        self._layer_index: Dict[int, int] = {}
+        # Layers keyed by name; names may repeat, so each maps to a list
+        self._layers_by_name: Dict[str, List[Layer]] = {}
         self._active_layer: Optional[Layer] = None
         self._context = get_app_context()
         
+        # Batched update state (see batch_updates)
+        self._batch_depth = 0
+        self._batch_added: List[Layer] = []
+        self._batch_removed: List[Layer] = []
+        self._batch_old_active: Optional[Layer] = None
+        
         # Register this viewer with the application context
         self._context.add_viewer(self)
     
     @property
-    def layers(self) -> List[Layer]:
-        """Get all layers."""
+    def layers(self) -> Tuple[Layer, ...]:
+        """Get all layers, as a tuple shared until the layers change."""
+        if self._layers_tuple is None:
+            self._layers_tuple = tuple(self._layers)
+        return self._layers_tuple
+    
+    def layers_snapshot(self) -> List[Layer]:
+        """Get a new list of all layers, for callers that modify it."""
         return self._layers.copy()
     
+    def contains(self, layer: Layer) -> bool:
+        """Check whether a layer is in the viewer."""
+        return id(layer) in self._layer_index
+    
+    def index_of(self, layer: Layer) -> int:
+        """
+        Get the position of a layer.
+        
+        Parameters
+        ----------
+        layer : Layer
+            The layer to look up.
+            
+        Returns
+        -------
+        int
+            Index of the layer in ``layers``, or -1 if it is not in the viewer.
+        """
+        return self._layer_index.get(id(layer), -1)
+    
+    def _reindex(self, start: int = 0, stop: Optional[int] = None):
+        """Record the positions of the layers in ``_layers[start:stop]``."""
+        layers = self._layers
+        stop = len(layers) if stop is None else stop
+        for i in range(start, stop):
+            self._layer_index[id(layers[i])] = i
+    
     @property
     def active_layer(self) -> Optional[Layer]:
         """Get the active layer."""
@@ -96,10 +196,53 @@ class Viewer(EventEmitter):
     @active_layer.setter
     def active_layer(self, layer: Optional[Layer]):
         """Set the active layer."""
-        if layer is None or layer in self._layers:
+        if layer is None or self.contains(layer):
             old_layer = self._active_layer
             self._active_layer = layer
-            self.emit('active_layer_changed', layer=layer, old_layer=old_layer)
+            if not self._batch_depth:
+                self.emit('active_layer_changed', layer=layer, old_layer=old_layer)
+    
+    @contextmanager
+    def batch_updates(self):
+        """
+        Coalesce layer changes into a single notification.
+        
+        Inside the context, ``layer_added``, ``layer_removed`` and
+        ``active_layer_changed`` are not emitted. When the outermost
+        context exits, a single ``layers_changed`` event is emitted with
+        the added and removed layers, followed by ``active_layer_changed``
+        if the active layer changed.
+        
+        Examples
+        --------
+        >>> with viewer.batch_updates():
+        ...     for data in images:
+        ...         viewer.add_image(data)
+        """
+        if self._batch_depth == 0:
+            self._batch_added = []
+            self._batch_removed = []
+            self._batch_old_active = self._active_layer
+        
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+    
+    def _flush_batch(self):
+        """Emit the coalesced events collected by batch_updates."""
+        added, self._batch_added = self._batch_added, []
+        removed, self._batch_removed = self._batch_removed, []
+        old_active, self._batch_old_active = self._batch_old_active, None
+        
+        if added or removed:
+            self.emit('layers_changed', added=added, removed=removed)
+        
+        if self._active_layer is not old_active:
+            self.emit('active_layer_changed', layer=self._active_layer, old_layer=old_active)
     
     def add_layer(self, layer: Layer, active: bool = True) -> Layer:
         """
@@ -116,13 +259,40 @@ class Viewer(EventEmitter):
         -------
         Layer
             The added layer.
+            
+        Raises
+        ------
+        ValueError
+            If the layer is already in the viewer.
+            
+        Notes
+        -----
+        A change of active layer is reported by the ``layer_added`` event
+        (``active`` and ``old_active``) instead of a separate
+        ``active_layer_changed`` event.
         """
+        if self.contains(layer):
+            raise ValueError(f"Layer {layer.name!r} is already in the viewer")
+        self._layer_index[id(layer)] = len(self._layers)
         self._layers.append(layer)
+        self._layers_tuple = None
+        self._layers_by_name.setdefault(layer.name, []).append(layer)
+        layer._viewers.add(self)
         
-        if active or self._active_layer is None:
-            self.active_layer = layer
+        old_active = self._active_layer
+        if active or old_active is None:
+            self._active_layer = layer
         
-        self.emit('layer_added', layer=layer)
+        if self._batch_depth:
+            self._batch_added.append(layer)
+        else:
+            self.emit(
+                'layer_added',
+                layer=layer,
+                index=len(self._layers) - 1,
+                active=self._active_layer is layer,
+                old_active=old_active,
+            )
         return layer
     
     def remove_layer(self, layer: Layer):
@@ -134,18 +304,29 @@ class Viewer(EventEmitter):
         layer : Layer
             The layer to remove.
         """
-        if layer in self._layers:
-            self._layers.remove(layer)
+        index = self._layer_index.pop(id(layer), None)
+        if index is not None:
+            del self._layers[index]
+            self._layers_tuple = None
+            self._reindex(index)
+            self._unindex_name(layer, layer.name)
+            layer._viewers.discard(self)
             
             if self._active_layer is layer:
                 self.active_layer = self._layers[-1] if self._layers else None
             
-            self.emit('layer_removed', layer=layer)
+            if self._batch_depth:
+                self._batch_removed.append(layer)
+            else:
+                self.emit('layer_removed', layer=layer, index=index)
     
     def add_image(self, data: Any, **kwargs) -> ImageLayer:
         """
         Add an image layer.
         
+        Floating-point arrays are stored as C-contiguous float32; passing
+        data in that layout avoids a copy.
+        
         Parameters
         ----------
         data : Any
@@ -158,7 +339,52 @@ class Viewer(EventEmitter):
         ImageLayer
             The created image layer.
         """
-        layer = ImageLayer(data, **kwargs)
+        layer = ImageLayer(_prepare_image_data(data), **kwargs)
+        return self.add_layer(layer)
+    
+    def add_image_shm(self, shm_name: str, shape, dtype, **kwargs) -> ImageLayer:
+        """
+        Add an image layer whose data lives in shared memory.
+        
+        The data is viewed in place, so producers in other processes can
+        hand over large arrays without pickling or copying them. The block
+        stays mapped for as long as the layer's data (or any array derived
+        from it) is alive; the creating process remains responsible for
+        unlinking it.
+        
+        Floating-point images must be float32, the layout ``add_image``
+        stores them in; other float types would have to be copied out of
+        the shared block, so they are rejected.
+        
+        Parameters
+        ----------
+        shm_name : str
+            Name of the shared memory block holding the image.
+        shape : tuple of int
+            Image shape.
+        dtype : data-type
+            Image data type.
+        **kwargs
+            Additional layer properties.
+            
+        Returns
+        -------
+        ImageLayer
+            The created image layer.
+            
+        Raises
+        ------
+        ValueError
+            If ``dtype`` is a floating-point type other than float32.
+        """
+        from ..utils.shared_array import attach_shared_array
+        
+        dtype = np.dtype(dtype)
+        if dtype.kind == 'f' and dtype != np.float32:
+            raise ValueError(
+                f"Shared memory images must be float32 to be viewed in place, got {dtype}"
+            )
+        layer = ImageLayer(attach_shared_array(shm_name, shape, dtype), **kwargs)
         return self.add_layer(layer)
     
     def add_points(self, data: Any, **kwargs) -> PointsLayer:
@@ -181,10 +407,36 @@ class Viewer(EventEmitter):
         return self.add_layer(layer)
     
     def clear_layers(self):
-        """Remove all layers."""
-        layers_to_remove = self._layers.copy()
-        for layer in layers_to_remove:
-            self.remove_layer(layer)
+        """
+        Remove all layers.
+        
+        The layers are removed in one pass and always reported with a
+        single ``layers_changed`` event. If anything listens for
+        ``layer_removed``, one is also emitted per layer beforehand, front
+        to back (each at index 0, as if removed one by one). These are
+        followed by ``active_layer_changed`` if there was an active layer.
+        """
+        if not self._layers:
+            return
+        
+        removed, self._layers = self._layers, []
+        self._layers_tuple = ()
+        self._layer_index.clear()
+        self._layers_by_name.clear()
+        for layer in removed:
+            layer._viewers.discard(self)
+        old_active, self._active_layer = self._active_layer, None
+        
+        if self._batch_depth:
+            self._batch_removed.extend(removed)
+            return
+        
+        if self.has_listeners('layer_removed'):
+            for layer in removed:
+                self.emit('layer_removed', layer=layer, index=0)
+        self.emit('layers_changed', added=[], removed=removed)
+        if old_active is not None:
+            self.emit('active_layer_changed', layer=None, old_layer=old_active)
     
     def get_layer_by_name(self, name: str) -> Optional[Layer]:
         """
@@ -200,10 +452,26 @@ class Viewer(EventEmitter):
         Layer or None
             The layer if found.
         """
-        for layer in self._layers:
-            if layer.name == name:
-                return layer
-        return None
+        layers = self._layers_by_name.get(name)
+        if not layers:
+            return None
+        if len(layers) == 1:
+            return layers[0]
+        # Several layers share the name: return the first in layer order
+        return min(layers, key=self.index_of)
+    
+    def _unindex_name(self, layer: Layer, name: str):
+        """Remove a layer from the name index entry for ``name``."""
+        layers = self._layers_by_name.get(name)
+        if layers is not None:
+            layers.remove(layer)
+            if not layers:
+                del self._layers_by_name[name]
+    
+    def _on_layer_renamed(self, layer: Layer, old_name: str):
+        """Move a renamed layer to its new name index entry."""
+        self._unindex_name(layer, old_name)
+        self._layers_by_name.setdefault(layer.name, []).append(layer)
     
     def move_layer(self, layer: Layer, index: int):
         """
@@ -216,10 +484,17 @@ class Viewer(EventEmitter):
         index : int
             New position index.
         """
-        if layer in self._layers:
-            self._layers.remove(layer)
+        from_index = self.index_of(layer)
+        if from_index >= 0:
+            self._layers.pop(from_index)
+            # Normalize like list.insert so listeners get the final position
+            if index < 0:
+                index += len(self._layers)
+            index = max(0, min(index, len(self._layers)))
             self._layers.insert(index, layer)
-            self.emit('layer_moved', layer=layer, index=index)
+            self._layers_tuple = None
+            self._reindex(min(from_index, index), max(from_index, index) + 1)
+            self.emit('layer_moved', layer=layer, index=index, from_index=from_index)
     
     def close(self):
         """Close the viewer and clean up resources."""
@@ -2,13 +2,20 @@
 Core event system implementation.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import bisect
+import inspect
+import logging
+import sys
+import types
 import weakref
 from dataclasses import dataclass
-from collections import defaultdict
+from ..utils.misc import DATACLASS_SLOTS
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Event:
     """
     Represents an event that can be emitted and handled.
@@ -39,32 +46,117 @@ class EventEmitter:
     def __init__(self):
         self._event_manager = EventManager()
     
-    def connect(self, event_type: str, callback: Callable[[Event], None]):
-        """Connect a callback to an event type."""
-        self._event_manager.connect(event_type, callback)
+    def connect(self, event_type: str, callback: Callable[[Event], None], weak: bool = True,
+                priority: int = 0) -> Any:
+        """
+        Connect a callback to an event type, returning a connection token.
+        
+        Callbacks are weakly referenced by default, so a subscribed widget
+        that is never disconnected can still be garbage collected. Pass
+        ``weak=False`` to keep e.g. a lambda alive. Callbacks with a higher
+        ``priority`` are called first.
+        """
+        return self._event_manager.connect(event_type, callback, weak=weak, priority=priority)
+    
+    def connect_many(self, pairs: Iterable[Tuple[str, Callable[[Event], None]]],
+                     weak: bool = True, priority: int = 0) -> List[Any]:
+        """
+        Connect several (event type, callback) pairs, returning their tokens.
+        
+        See ``EventManager.connect_many``.
+        """
+        return self._event_manager.connect_many(pairs, weak=weak, priority=priority)
     
     def disconnect(self, event_type: str, callback: Callable[[Event], None]):
-        """Disconnect a callback from an event type."""
+        """Disconnect a callback (or connection token) from an event type."""
         self._event_manager.disconnect(event_type, callback)
     
+    def has_listeners(self, event_type: str) -> bool:
+        """Check whether any callback is connected to an event type."""
+        return self._event_manager.has_listeners(event_type)
+    
     def emit(self, event_type: str, **data):
         """Emit an event with optional data."""
+        # Skip building the Event when nobody is listening
+        if not self._event_manager.has_listeners(event_type):
+            return
         event = Event(type=event_type, source=self, data=data)
         self._event_manager.emit(event)
 
 
+def _make_ref(callback: Callable, on_dead: Optional[Callable] = None) -> Any:
+    """
+    Create a weak reference to a callback.
+    
+    Bound methods are referenced with ``weakref.WeakMethod`` so that the
+    reference lives as long as the instance. Callables that cannot be
+    weakly referenced (e.g. builtin methods) are returned unchanged.
+    ``on_dead`` is called with the reference once its target is collected.
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback, on_dead)
+    try:
+        return weakref.ref(callback, on_dead)
+    except TypeError:
+        return callback
+
+
+def _callback_key(callback: Callable) -> Any:
+    """
+    Identify a callback for lookup in the connection index.
+    
+    Bound methods are keyed by their instance and function, because
+    ``obj.method`` creates a new method object on every access. The same
+    holds for methods of builtin types (e.g. ``some_list.append``), which
+    are keyed by their instance and name.
+    """
+    if inspect.ismethod(callback):
+        return (id(callback.__self__), id(callback.__func__))
+    if isinstance(callback, (types.BuiltinMethodType, types.MethodWrapperType)):
+        owner = callback.__self__
+        if owner is not None and not isinstance(owner, types.ModuleType):
+            return (id(owner), callback.__name__)
+    return id(callback)
+
+
 class EventManager:
     """
     Manages event connections and emission.
+    
+    Callbacks for each event type are stored in a tuple whose entries are
+    either strong references (the callable itself) or weak references
+    (``weakref.ref``/``weakref.WeakMethod``). Connecting and disconnecting
+    replace the tuple instead of mutating it, so emitting walks the
+    current tuple directly, and callbacks may connect or disconnect while
+    an event is being emitted.
+    
+    Entries are kept in priority order, highest first and in connection
+    order for equal priorities, so emitting never sorts.
+    
+    Each entry is also indexed by its callback, so disconnecting does not
+    scan the tuple, and weak entries remove themselves when their target
+    is collected. A callback is connected at most once per event type.
+    
+    Attributes
+    ----------
+    on_error : Callable, optional
+        Called as ``on_error(event, callback, error)`` when a callback
+        raises. If None, the error is logged. Either way, the remaining
+        callbacks still run.
     """
     
+    on_error: Optional[Callable[[Event, Callable, Exception], None]] = None
+    
     def __init__(self):
-        # Use defaultdict with list to store multiple callbacks per event type
-        self._callbacks: Dict[str, List[Callable]] = defaultdict(list)
-        # Use weak references to avoid memory leaks
-        self._weak_callbacks: Dict[str, List[weakref.ref]] = defaultdict(list)
+        # Callables or weak references to them, per event type
+        self._callbacks: Dict[str, Tuple[Any, ...]] = {}
+        # Entry of each connected callback, per event type
+        self._index: Dict[str, Dict[Any, Any]] = {}
+        # Negated priority of each entry, aligned with _callbacks
+        self._priorities: Dict[str, List[int]] = {}
     
-    def connect(self, event_type: str, callback: Callable[[Event], None], weak: bool = True):
+    def connect(self, event_type: str, callback: Callable[[Event], None], weak: bool = True,
+                priority: int = 0):
         """
         Connect a callback to an event type.
         
@@ -76,13 +168,94 @@ class EventManager:
             The function to call when the event is emitted.
         weak : bool, optional
             Whether to use weak references. Default is True.
+        priority : int, optional
+            Callbacks with a higher priority are called first; equal
+            priorities are called in connection order. Default is 0.
+            
+        Returns
+        -------
+        Any
+            Connection token. Passing it to ``disconnect`` removes this
+            connection. Connecting a callback again returns its token.
         """
-        if weak:
-            # Use weak reference to avoid memory leaks
-            weak_ref = weakref.ref(callback)
-            self._weak_callbacks[event_type].append(weak_ref)
-        else:
-            self._callbacks[event_type].append(callback)
+        # Emitters pass string literals, which are interned; interning the
+        # stored key too lets dict lookups match on identity
+        event_type = sys.intern(event_type)
+        key = _callback_key(callback)
+        index = self._index.setdefault(event_type, {})
+        entry = index.get(key)
+        if entry is not None:
+            return entry
+        
+        entry = index[key] = self._make_entry(event_type, key, callback, weak)
+        self._insert(event_type, (entry,), priority)
+        return entry
+    
+    def connect_many(self, pairs: Iterable[Tuple[str, Callable[[Event], None]]],
+                     weak: bool = True, priority: int = 0) -> List[Any]:
+        """
+        Connect several callbacks at once.
+        
+        Equivalent to calling ``connect`` for each pair, but the callbacks
+        of each event type are rebuilt once rather than once per callback.
+        
+        Parameters
+        ----------
+        pairs : Iterable[Tuple[str, Callable]]
+            (event type, callback) pairs to connect.
+        weak : bool, optional
+            Whether to use weak references. Default is True.
+        priority : int, optional
+            Priority of all the connections. Default is 0.
+            
+        Returns
+        -------
+        List[Any]
+            Connection token of each pair, in order.
+        """
+        tokens = []
+        added: Dict[str, List[Any]] = {}
+        # Keep the callbacks alive until their entries are inserted, so a
+        # weak entry cannot try to remove itself before it is in place
+        callbacks = []
+        for event_type, callback in pairs:
+            event_type = sys.intern(event_type)
+            key = _callback_key(callback)
+            index = self._index.setdefault(event_type, {})
+            entry = index.get(key)
+            if entry is None:
+                entry = index[key] = self._make_entry(event_type, key, callback, weak)
+                added.setdefault(event_type, []).append(entry)
+                callbacks.append(callback)
+            tokens.append(entry)
+        
+        for event_type, entries in added.items():
+            self._insert(event_type, tuple(entries), priority)
+        return tokens
+    
+    def _make_entry(self, event_type: str, key: Any, callback: Callable, weak: bool) -> Any:
+        """Create the stored entry for a callback."""
+        if not weak:
+            return callback
+        
+        # Use weak reference to avoid memory leaks
+        manager_ref = weakref.ref(self)
+        
+        def on_dead(ref):
+            manager = manager_ref()
+            if manager is not None:
+                manager._remove(event_type, key, ref)
+        
+        return _make_ref(callback, on_dead)
+    
+    def _insert(self, event_type: str, new_entries: Tuple[Any, ...], priority: int):
+        """Insert entries of one priority into the callbacks of an event type."""
+        priorities = self._priorities.setdefault(event_type, [])
+        # After any entries of the same priority
+        position = bisect.bisect_right(priorities, -priority)
+        priorities[position:position] = [-priority] * len(new_entries)
+        entries = self._callbacks.get(event_type, ())
+        self._callbacks[event_type] = entries[:position] + new_entries + entries[position:]
     
     def disconnect(self, event_type: str, callback: Callable[[Event], None]):
         """
@@ -93,20 +266,52 @@ class EventManager:
         event_type : str
             The type of event to stop listening for.
         callback : Callable
-            The function to disconnect.
+            The function to disconnect, or a token returned by ``connect``.
         """
-        # Remove from strong references
-        if callback in self._callbacks[event_type]:
-            self._callbacks[event_type].remove(callback)
-        
-        # Remove from weak references
-        to_remove = []
-        for weak_ref in self._weak_callbacks[event_type]:
-            if weak_ref() is callback:
-                to_remove.append(weak_ref)
+        index = self._index.get(event_type)
+        if not index:
+            return
+        if isinstance(callback, weakref.ref):
+            # A token; once its target is gone it has removed itself
+            callback = callback()
+            if callback is None:
+                return
+        key = _callback_key(callback)
+        entry = index.get(key)
+        if entry is not None:
+            self._remove(event_type, key, entry)
+    
+    def _remove(self, event_type: str, key: Any, entry: Any):
+        """Remove an entry from the index and callbacks of an event type."""
+        index = self._index.get(event_type)
+        if index is None or index.get(key) is not entry:
+            return
+        del index[key]
+        if not index:
+            del self._index[event_type]
+            del self._priorities[event_type]
+            self._callbacks.pop(event_type, None)
+            return
+        entries = self._callbacks[event_type]
+        position = next(i for i, other in enumerate(entries) if other is entry)
+        del self._priorities[event_type][position]
+        self._callbacks[event_type] = entries[:position] + entries[position + 1:]
+    
+    def has_listeners(self, event_type: str) -> bool:
+        """
+        Check whether any callback is connected to an event type.
         
-        for weak_ref in to_remove:
-            self._weak_callbacks[event_type].remove(weak_ref)
+        Parameters
+        ----------
+        event_type : str
+            The event type to check.
+            
+        Returns
+        -------
+        bool
+            True if the event type has connected callbacks.
+        """
+        return event_type in self._callbacks
     
     def emit(self, event: Event):
         """
@@ -117,29 +322,20 @@ class EventManager:
         event : Event
             The event to emit.
         """
-        # Call strong reference callbacks
-        for callback in self._callbacks[event.type]:
+        for entry in self._callbacks.get(event.type, ()):
+            callback = entry() if isinstance(entry, weakref.ref) else entry
+            if callback is None:
+                continue
+            # The try block is free until a callback raises (Python 3.11+
+            # zero-cost exceptions), so errors are isolated here rather
+            # than by wrapping each callback at connect time
             try:
                 callback(event)
             except Exception as e:
-                print(f"Error in event callback: {e}")
-        
-        # Call weak reference callbacks (clean up dead references)
-        to_remove = []
-        for weak_ref in self._weak_callbacks[event.type]:
-            callback = weak_ref()
-            if callback is None:
-                # Dead reference, mark for removal
-                to_remove.append(weak_ref)
-            else:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"Error in event callback: {e}")
-        
-        # Clean up dead weak references
-        for weak_ref in to_remove:
-            self._weak_callbacks[event.type].remove(weak_ref)
+                if self.on_error is not None:
+                    self.on_error(event, callback, e)
+                else:
+                    logger.exception("Error in event callback")
     
     def clear(self, event_type: Optional[str] = None):
         """
@@ -152,10 +348,12 @@ class EventManager:
         """
         if event_type is None:
             self._callbacks.clear()
-            self._weak_callbacks.clear()
+            self._index.clear()
+            self._priorities.clear()
         else:
-            self._callbacks[event_type].clear()
-            self._weak_callbacks[event_type].clear()
+            self._callbacks.pop(event_type, None)
+            self._index.pop(event_type, None)
+            self._priorities.pop(event_type, None)
 
 
 # Global event manager instance
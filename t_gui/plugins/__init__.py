@@ -5,8 +5,29 @@ This module provides a flexible plugin system that allows extending
 the application with custom functionality.
 """
 
-from .manager import PluginManager
-from .hookspecs import hookspecs
-from .registry import PluginRegistry
+import importlib
 
-__all__ = ['PluginManager', 'hookspecs', 'PluginRegistry']
+# Names resolved on first access, so that reading plugin metadata through
+# the registry does not import pluggy
+_LAZY = {
+    'PluginManager': ('t_gui.plugins.manager', 'PluginManager'),
+    'hookspecs': ('t_gui.plugins.hookspecs', 'hookspecs'),
+    'hookimpl': ('t_gui.plugins.hookspecs', 'hookimpl'),
+    'PluginRegistry': ('t_gui.plugins.registry', 'PluginRegistry'),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attribute = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = ['PluginManager', 'hookspecs', 'hookimpl', 'PluginRegistry']
@@ -9,18 +9,46 @@ import pluggy
 from typing import Any, Dict, List, Optional, Callable
 
 
-# Create the hook specification namespace
+# Create the hook specification namespace. The markers only tag the
+# decorated function and return it unchanged, so marked hooks carry no
+# per-call overhead; set T_GUI_HOOK_STRICT=1 to have the plugin manager
+# validate implementations against the specifications at load time.
 hookspec = pluggy.HookspecMarker("t_gui")
 
+# Marker for hook implementations in plugins
+hookimpl = pluggy.HookimplMarker("t_gui")
+
 
 class TGuiHookSpecs:
     """Hook specifications for T-GUI plugins."""
     
+    @hookspec
+    def t_gui_get_contributions(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all contributions from the plugin in one call.
+        
+        This is the preferred way to contribute; the per-kind
+        ``t_gui_get_*_contributions`` hooks are deprecated and only
+        called when some plugin still implements them.
+        
+        Returns
+        -------
+        Dict[str, List[Dict[str, Any]]]
+            Contribution lists keyed by kind: 'actions', 'widgets',
+            'menus', 'readers' and 'writers'. Each list holds the same
+            dictionaries as the corresponding deprecated hook returns.
+            Missing kinds contribute nothing.
+        """
+        pass
+    
     @hookspec
     def t_gui_get_widget_contributions(self) -> List[Dict[str, Any]]:
         """
         Get widget contributions from the plugin.
         
+        Deprecated: return them under 'widgets' from
+        ``t_gui_get_contributions`` instead.
+        
         Returns
         -------
         List[Dict[str, Any]]
@@ -36,6 +64,9 @@ class TGuiHookSpecs:
         """
         Get menu contributions from the plugin.
         
+        Deprecated: return them under 'menus' from
+        ``t_gui_get_contributions`` instead.
+        
         Returns
         -------
         List[Dict[str, Any]]
@@ -51,6 +82,9 @@ class TGuiHookSpecs:
         """
         Get action contributions from the plugin.
         
+        Deprecated: return them under 'actions' from
+        ``t_gui_get_contributions`` instead.
+        
         Returns
         -------
         List[Dict[str, Any]]
@@ -69,6 +103,9 @@ class TGuiHookSpecs:
         """
         Get file reader contributions from the plugin.
         
+        Deprecated: return them under 'readers' from
+        ``t_gui_get_contributions`` instead.
+        
         Returns
         -------
         List[Dict[str, Any]]
@@ -84,6 +121,9 @@ class TGuiHookSpecs:
         """
         Get file writer contributions from the plugin.
         
+        Deprecated: return them under 'writers' from
+        ``t_gui_get_contributions`` instead.
+        
         Returns
         -------
         List[Dict[str, Any]]
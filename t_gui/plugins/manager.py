@@ -2,13 +2,60 @@
 Plugin manager for T-GUI.
 """
 
+import logging
+import os
 import pluggy
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from .hookspecs import hookspecs
 from .registry import PluginRegistry, PluginInfo
 from ..app_model.context import get_app_context
 from ..app_model.actions import get_action_manager, Action
 
+logger = logging.getLogger(__name__)
+
+
+# Validate hook implementations against the specifications when plugins
+# are loaded (development aid, off by default)
+HOOK_STRICT = os.environ.get("T_GUI_HOOK_STRICT", "0") == "1"
+
+
+# Contribution kinds, with the context event announcing each kind
+# (actions are registered with the action manager instead)
+_CONTRIBUTION_EVENTS = {
+    'actions': None,
+    'widgets': 'widget_contributions',
+    'menus': 'menu_contributions',
+    'readers': 'reader_contributions',
+    'writers': 'writer_contributions',
+}
+
+# Contribution hooks in bit order: the single hook, then the deprecated
+# per-kind hooks with the contribution kind each returns
+_CONTRIBUTION_HOOKS = (
+    ('t_gui_get_contributions', None),
+    ('t_gui_get_action_contributions', 'actions'),
+    ('t_gui_get_widget_contributions', 'widgets'),
+    ('t_gui_get_menu_contributions', 'menus'),
+    ('t_gui_get_reader_contributions', 'readers'),
+    ('t_gui_get_writer_contributions', 'writers'),
+)
+_CONTRIBUTION_HOOK_BITS = {
+    name: 1 << bit for bit, (name, _) in enumerate(_CONTRIBUTION_HOOKS)
+}
+
+# Keyword arguments accepted by Action; other contribution keys are ignored
+_ACTION_FIELDS = frozenset(field.name for field in fields(Action))
+
+
+def _make_action(action_data: Dict[str, Any]) -> Action:
+    """Create an action from a plugin's action contribution."""
+    return Action(**{
+        key: value for key, value in action_data.items() if key in _ACTION_FIELDS
+    })
+
 
 class PluginManager:
     """
@@ -18,8 +65,21 @@ class PluginManager:
     def __init__(self):
         self._pm = pluggy.PluginManager("t_gui")
         self._pm.add_hookspecs(hookspecs)
+        
+        # Hook callers are created by add_hookspecs and stay the same
+        # objects, so resolve them once instead of through pm.hook per call
+        hook = self._pm.hook
+        self._hook_setup = hook.t_gui_setup_plugin
+        self._hook_teardown = hook.t_gui_teardown_plugin
+        self._contribution_hooks = tuple(
+            (1 << bit, getattr(hook, name), kind)
+            for bit, (name, kind) in enumerate(_CONTRIBUTION_HOOKS)
+        )
+        
         self._registry = PluginRegistry()
         self._loaded_plugins: Dict[str, Any] = {}
+        # Bitmask of the contribution hooks each loaded plugin implements
+        self._plugin_hook_masks: Dict[str, int] = {}
         self._context = get_app_context()
         self._action_manager = get_action_manager()
     
@@ -53,7 +113,10 @@ class PluginManager:
         plugin_info = self._registry.get_plugin(plugin_name)
         if not plugin_info or not plugin_info.enabled:
             return False
+        # Key loaded plugins by the registry's interned name
+        plugin_name = plugin_info.name
         
+        module = None
         try:
             # Load the plugin module
             module = self._registry.load_plugin_module(plugin_name)
@@ -62,10 +125,21 @@ class PluginManager:
             
             # Register the plugin with pluggy
             self._pm.register(module, name=plugin_name)
+            
+            if HOOK_STRICT:
+                # Fail on hook implementations without a matching spec,
+                # before the plugin is recorded as loaded
+                self._pm.check_pending()
+            
             self._loaded_plugins[plugin_name] = module
             
+            mask = 0
+            for hook_caller in self._pm.get_hookcallers(module) or ():
+                mask |= _CONTRIBUTION_HOOK_BITS.get(hook_caller.name, 0)
+            self._plugin_hook_masks[plugin_name] = mask
+            
             # Call setup hook
-            self._pm.hook.t_gui_setup_plugin(plugin_manager=self)
+            self._hook_setup(plugin_manager=self)
             
             # Process plugin contributions
             self._process_plugin_contributions(plugin_name)
@@ -73,8 +147,13 @@ class PluginManager:
             self._context.emit('plugin_loaded', plugin_name=plugin_name)
             return True
             
-        except Exception as e:
-            print(f"Error loading plugin {plugin_name}: {e}")
+        except Exception:
+            logger.exception("Error loading plugin %s", plugin_name)
+            # Leave nothing registered, so later loads are not affected
+            if module is not None and self._pm.is_registered(module):
+                self._pm.unregister(module, name=plugin_name)
+            self._loaded_plugins.pop(plugin_name, None)
+            self._plugin_hook_masks.pop(plugin_name, None)
             return False
     
     def unload_plugin(self, plugin_name: str) -> bool:
@@ -91,29 +170,52 @@ class PluginManager:
         bool
             True if plugin was unloaded successfully.
         """
-        if plugin_name not in self._loaded_plugins:
+        plugin = self._loaded_plugins.get(plugin_name)
+        if plugin is None:
             return True
         
         try:
             # Call teardown hook
-            self._pm.hook.t_gui_teardown_plugin(plugin_manager=self)
+            self._hook_teardown(plugin_manager=self)
             
             # Unregister from pluggy
-            plugin = self._loaded_plugins[plugin_name]
             self._pm.unregister(plugin, name=plugin_name)
             del self._loaded_plugins[plugin_name]
+            self._plugin_hook_masks.pop(plugin_name, None)
             
             self._context.emit('plugin_unloaded', plugin_name=plugin_name)
             return True
             
-        except Exception as e:
-            print(f"Error unloading plugin {plugin_name}: {e}")
+        except Exception:
+            logger.exception("Error unloading plugin %s", plugin_name)
             return False
     
     def load_all_plugins(self):
-        """Load all enabled plugins."""
-        for plugin_info in self._registry.get_enabled_plugins():
-            self.load_plugin(plugin_info.name)
+        """
+        Load all enabled plugins.
+        
+        Plugin modules are imported on a thread pool first, so their file
+        reads overlap; registration and contribution processing then run
+        one plugin at a time on the calling thread.
+        """
+        names = [plugin_info.name for plugin_info in self._registry.get_enabled_plugins()]
+        if len(names) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+                # Imported modules are cached by the registry; plugins that
+                # failed to import (and were logged) are not retried
+                modules = executor.map(self._import_plugin_module, names)
+                names = [name for name, module in zip(names, modules) if module is not None]
+        
+        for plugin_name in names:
+            self.load_plugin(plugin_name)
+    
+    def _import_plugin_module(self, plugin_name: str) -> Optional[Any]:
+        """Import a plugin module, logging any error instead of raising it."""
+        try:
+            return self._registry.load_plugin_module(plugin_name)
+        except Exception:
+            logger.exception("Error loading plugin %s", plugin_name)
+            return None
     
     def unload_all_plugins(self):
         """Unload all loaded plugins."""
@@ -164,64 +266,74 @@ class PluginManager:
         """
         return list(self._loaded_plugins.keys())
     
+    def _collect_contributions(self, plugin_name: str, mask: int) -> Dict[str, List[List[Dict[str, Any]]]]:
+        """
+        Gather the contribution lists of every kind from one plugin.
+        
+        Only the hooks whose bit is set in ``mask`` are called, and only
+        the plugin's own implementation of each; the deprecated per-kind
+        hooks are merged with the single ``t_gui_get_contributions`` hook.
+        """
+        collected: Dict[str, List[List[Dict[str, Any]]]] = {
+            kind: [] for kind in _CONTRIBUTION_EVENTS
+        }
+        plugin = self._loaded_plugins[plugin_name]
+        for bit, hook_caller, kind in self._contribution_hooks:
+            if not mask & bit:
+                continue
+            for hookimpl in hook_caller.get_hookimpls():
+                if hookimpl.plugin is plugin:
+                    result = hookimpl.function()
+                    break
+            else:
+                continue
+            if not result:
+                continue
+            if kind is not None:
+                collected[kind].append(result)
+                continue
+            for kind, contributions in result.items():
+                if contributions and kind in collected:
+                    collected[kind].append(contributions)
+        return collected
+    
     def _process_plugin_contributions(self, plugin_name: str):
         """Process contributions from a loaded plugin."""
+        mask = self._plugin_hook_masks.get(plugin_name, 0)
+        if not mask:
+            # The plugin implements none of the contribution hooks
+            return
+        
         try:
+            collected = self._collect_contributions(plugin_name, mask)
+            
             # Process action contributions
-            action_contributions = self._pm.hook.t_gui_get_action_contributions()
-            for contributions in action_contributions:
-                if contributions:
-                    for action_data in contributions:
-                        action = Action(
-                            id=action_data['id'],
-                            title=action_data['title'],
-                            callback=action_data['callback'],
-                            tooltip=action_data.get('tooltip'),
-                            icon=action_data.get('icon'),
-                            shortcut=action_data.get('shortcut'),
-                            enabled=action_data.get('enabled', True)
-                        )
-                        self._action_manager.register_action(action)
-            
-            # Process widget contributions
-            widget_contributions = self._pm.hook.t_gui_get_widget_contributions()
-            for contributions in widget_contributions:
-                if contributions:
-                    self._context.emit('widget_contributions', 
-                                     plugin_name=plugin_name, 
-                                     contributions=contributions)
-            
-            # Process menu contributions
-            menu_contributions = self._pm.hook.t_gui_get_menu_contributions()
-            for contributions in menu_contributions:
-                if contributions:
-                    self._context.emit('menu_contributions',
-                                     plugin_name=plugin_name,
-                                     contributions=contributions)
-            
-            # Process reader contributions
-            reader_contributions = self._pm.hook.t_gui_get_reader_contributions()
-            for contributions in reader_contributions:
-                if contributions:
-                    self._context.emit('reader_contributions',
-                                     plugin_name=plugin_name,
-                                     contributions=contributions)
-            
-            # Process writer contributions
-            writer_contributions = self._pm.hook.t_gui_get_writer_contributions()
-            for contributions in writer_contributions:
-                if contributions:
-                    self._context.emit('writer_contributions',
-                                     plugin_name=plugin_name,
-                                     contributions=contributions)
+            self._action_manager.register_actions(
+                _make_action(action_data)
+                for contributions in collected['actions']
+                for action_data in contributions
+            )
+            
+            # Hand widget, menu, reader and writer contributions to the UI
+            for kind, event_type in _CONTRIBUTION_EVENTS.items():
+                if event_type is None:
+                    continue
+                for contributions in collected[kind]:
+                    self._context.emit(event_type,
+                                       plugin_name=plugin_name,
+                                       contributions=contributions)
                                      
-        except Exception as e:
-            print(f"Error processing contributions for plugin {plugin_name}: {e}")
+        except Exception:
+            logger.exception("Error processing contributions for plugin %s", plugin_name)
 
 
-# Global plugin manager instance
-_global_plugin_manager = PluginManager()
-
+# Global plugin manager, created on first use
+@lru_cache(maxsize=None)
 def get_plugin_manager() -> PluginManager:
     """Get the global plugin manager."""
-    return _global_plugin_manager
+    return PluginManager()
+
+
+def _reset_plugin_manager():
+    """Discard the global plugin manager, e.g. between tests."""
+    get_plugin_manager.cache_clear()
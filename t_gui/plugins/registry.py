@@ -2,16 +2,25 @@
 Plugin registry for managing plugin metadata and discovery.
 """
 
+import logging
 import os
 import sys
 import importlib
-import importlib.util
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
+from ..utils.misc import DATACLASS_SLOTS
 
+try:
+    # Optional, faster parser for plugin.json metadata
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PluginInfo:
     """
     Information about a plugin.
@@ -51,6 +60,9 @@ class PluginRegistry:
         self._plugins: Dict[str, PluginInfo] = {}
         self._plugin_paths: List[Path] = []
         self._loaded_modules: Dict[str, Any] = {}
+        # Result of get_enabled_plugins, rebuilt on the first call after
+        # plugins are (un)registered, enabled or disabled
+        self._enabled_cache: Optional[List[PluginInfo]] = None
     
     def add_plugin_path(self, path: Path):
         """
@@ -73,7 +85,10 @@ class PluginRegistry:
         plugin_info : PluginInfo
             Plugin information.
         """
+        # Interned, so lookups with the same name match on identity
+        plugin_info.name = sys.intern(plugin_info.name)
         self._plugins[plugin_info.name] = plugin_info
+        self._invalidate_cache()
     
     def unregister_plugin(self, plugin_name: str):
         """
@@ -86,6 +101,7 @@ class PluginRegistry:
         """
         if plugin_name in self._plugins:
             del self._plugins[plugin_name]
+            self._invalidate_cache()
         if plugin_name in self._loaded_modules:
             del self._loaded_modules[plugin_name]
     
@@ -120,28 +136,45 @@ class PluginRegistry:
         """
         Get all enabled plugins.
         
+        Set ``enabled`` through ``enable_plugin``/``disable_plugin``; the
+        result is cached and only refreshed by those methods and by
+        (un)registering plugins.
+        
         Returns
         -------
         List[PluginInfo]
             List of enabled plugin information.
         """
-        return [plugin for plugin in self._plugins.values() if plugin.enabled]
+        if self._enabled_cache is None:
+            self._enabled_cache = [plugin for plugin in self._plugins.values() if plugin.enabled]
+        return self._enabled_cache.copy()
+    
+    def _invalidate_cache(self):
+        """Drop the cached list of enabled plugins."""
+        self._enabled_cache = None
     
     def discover_plugins(self):
         """
         Discover plugins in the registered plugin paths.
         """
         for plugin_path in self._plugin_paths:
-            if not plugin_path.exists():
+            try:
+                # DirEntry caches the type from the directory listing, so
+                # only packages cost an extra stat (for __init__.py)
+                with os.scandir(plugin_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith('.') or name == "__pycache__":
+                            continue
+                        if entry.is_dir():
+                            if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                                # Python package
+                                self._discover_package_plugin(Path(entry.path))
+                        elif name.endswith(".py") and name != "__init__.py":
+                            # Python module
+                            self._discover_module_plugin(Path(entry.path))
+            except (FileNotFoundError, NotADirectoryError):
                 continue
-                
-            for item in plugin_path.iterdir():
-                if item.is_dir() and (item / "__init__.py").exists():
-                    # Python package
-                    self._discover_package_plugin(item)
-                elif item.suffix == ".py" and item.name != "__init__.py":
-                    # Python module
-                    self._discover_module_plugin(item)
     
     def _discover_package_plugin(self, package_path: Path):
         """Discover a plugin from a Python package."""
@@ -149,9 +182,7 @@ class PluginRegistry:
             # Look for plugin metadata
             metadata_file = package_path / "plugin.json"
             if metadata_file.exists():
-                import json
-                with open(metadata_file) as f:
-                    metadata = json.load(f)
+                metadata = _json_loads(metadata_file.read_bytes())
                 
                 plugin_info = PluginInfo(
                     name=metadata.get("name", package_path.name),
@@ -171,8 +202,8 @@ class PluginRegistry:
                 )
                 self.register_plugin(plugin_info)
                 
-        except Exception as e:
-            print(f"Error discovering plugin {package_path}: {e}")
+        except Exception:
+            logger.exception("Error discovering plugin %s", package_path)
     
     def _discover_module_plugin(self, module_path: Path):
         """Discover a plugin from a Python module."""
@@ -183,8 +214,8 @@ class PluginRegistry:
                 module_name=module_name
             )
             self.register_plugin(plugin_info)
-        except Exception as e:
-            print(f"Error discovering plugin {module_path}: {e}")
+        except Exception:
+            logger.exception("Error discovering plugin %s", module_path)
     
     def load_plugin_module(self, plugin_name: str) -> Optional[Any]:
         """
@@ -212,8 +243,8 @@ class PluginRegistry:
             module = importlib.import_module(plugin_info.module_name)
             self._loaded_modules[plugin_name] = module
             return module
-        except ImportError as e:
-            print(f"Error loading plugin {plugin_name}: {e}")
+        except ImportError:
+            logger.exception("Error loading plugin %s", plugin_name)
             return None
     
     def enable_plugin(self, plugin_name: str):
@@ -228,6 +259,7 @@ class PluginRegistry:
         plugin_info = self.get_plugin(plugin_name)
         if plugin_info:
             plugin_info.enabled = True
+            self._enabled_cache = None
     
     def disable_plugin(self, plugin_name: str):
         """
@@ -241,3 +273,4 @@ class PluginRegistry:
         plugin_info = self.get_plugin(plugin_name)
         if plugin_info:
             plugin_info.enabled = False
+            self._enabled_cache = None
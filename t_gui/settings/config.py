@@ -3,10 +3,113 @@ Configuration management for T-GUI.
 """
 
 import os
+import sys
 import json
+import logging
+import tempfile
+import threading
+import time
+import types
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from pathlib import Path
 from ..events import EventEmitter
+from ..utils.misc import deep_merge_dicts_inplace
+
+try:
+    # Optional, faster encoder and parser for config.json
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Delay in seconds before a requested save is written, so that changes
+# made in quick succession are saved together
+SAVE_DELAY = 0.1
+
+# Files modified more recently than this (in ns) are parsed without the
+# cache: on filesystems with coarse timestamps, a second change within the
+# same tick could otherwise keep the same stat key
+_RACY_WINDOW_NS = 2_000_000_000
+
+if orjson is not None:
+    def _encode_settings(settings: Dict[str, Any]) -> bytes:
+        """Encode settings as indented JSON."""
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _decode_settings = orjson.loads
+else:
+    def _encode_settings(settings: Dict[str, Any]) -> bytes:
+        """Encode settings as indented JSON."""
+        return json.dumps(settings, indent=2).encode()
+    
+    # Accepts the raw bytes of the file
+    _decode_settings = json.loads
+
+# Default settings, shared by all instances and copied when settings are
+# loaded or reset
+_DEFAULT_SETTINGS = types.MappingProxyType({
+    'appearance': {
+        'theme': 'dark',
+        'font_size': 10,
+        'font_family': 'Arial'
+    },
+    'viewer': {
+        'background_color': '#2b2b2b',
+        'default_colormap': 'gray',
+        'interpolation': 'nearest'
+    },
+    'plugins': {
+        'auto_discover': True,
+        'auto_load': False,
+        'plugin_dirs': []
+    },
+    'performance': {
+        'max_layers': 100,
+        'cache_size_mb': 512,
+        'async_rendering': True,
+        'uniform_row_heights': True
+    }
+})
+
+# Marks keys missing from the flat index (None is a valid setting value)
+_MISSING = object()
+
+
+@lru_cache(maxsize=8)
+def _read_settings_file(path: str, mtime_ns: int, ctime_ns: int, size: int,
+                        inode: int) -> Dict[str, Any]:
+    """
+    Parse a config file.
+    
+    Results are cached by path and the file's stat key (modification and
+    change times, size and inode), so unchanged files are not parsed again.
+    The same dict is returned to every caller with the same key: callers
+    must copy it before modifying it.
+    """
+    with open(path, 'rb') as f:
+        return _decode_settings(f.read())
+
+
+@lru_cache(maxsize=None)
+def _default_file_mode() -> int:
+    """Get the permissions open() gives new files under the current umask."""
+    # The umask can only be read by setting it, so it is read once
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@lru_cache(maxsize=None)
+def _get_default_config_dir() -> Path:
+    """Get the default configuration directory (resolved once)."""
+    if os.name == 'nt':  # Windows
+        config_dir = Path(os.environ.get('APPDATA', '')) / 't_gui'
+    else:  # Unix-like
+        config_dir = Path.home() / '.config' / 't_gui'
+    
+    return config_dir
 
 
 class Settings(EventEmitter):
@@ -16,65 +119,53 @@ class Settings(EventEmitter):
     Settings are stored in JSON format and can be persisted to disk.
     """
     
+    _defaults = _DEFAULT_SETTINGS
+    
     def __init__(self, config_dir: Optional[Path] = None):
         super().__init__()
         
         # Determine config directory
         if config_dir is None:
-            config_dir = self._get_default_config_dir()
+            config_dir = _get_default_config_dir()
         
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "config.json"
         
-        # Default settings
-        self._defaults = {
-            'appearance': {
-                'theme': 'dark',
-                'font_size': 10,
-                'font_family': 'Arial'
-            },
-            'viewer': {
-                'background_color': '#2b2b2b',
-                'default_colormap': 'gray',
-                'interpolation': 'nearest'
-            },
-            'plugins': {
-                'auto_discover': True,
-                'auto_load': False,
-                'plugin_dirs': []
-            },
-            'performance': {
-                'max_layers': 100,
-                'cache_size_mb': 512,
-                'async_rendering': True
-            }
-        }
-        
         self._settings: Dict[str, Any] = {}
+        # Flat indexes of self._settings keyed by dotted path: leaf values,
+        # and the nested dicts of groups (e.g. 'appearance')
+        self._flat: Dict[str, Any] = {}
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        # Guards the settings tree against the deferred save thread
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
         self._load_settings()
     
-    def _get_default_config_dir(self) -> Path:
-        """Get the default configuration directory."""
-        if os.name == 'nt':  # Windows
-            config_dir = Path(os.environ.get('APPDATA', '')) / 't_gui'
-        else:  # Unix-like
-            config_dir = Path.home() / '.config' / 't_gui'
-        
-        return config_dir
-    
     def _load_settings(self):
         """Load settings from file."""
         # Start with defaults
         self._settings = self._deep_copy_dict(self._defaults)
         
         # Load from file if it exists
-        if self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is not None:
             try:
-                with open(self.config_file, 'r') as f:
-                    file_settings = json.load(f)
-                self._merge_settings(self._settings, file_settings)
-            except Exception as e:
-                print(f"Error loading settings: {e}")
+                key = (str(self.config_file), stat.st_mtime_ns, stat.st_ctime_ns,
+                       stat.st_size, stat.st_ino)
+                if time.time_ns() - max(stat.st_mtime_ns, stat.st_ctime_ns) < _RACY_WINDOW_NS:
+                    # Too recent for the stat key to be trusted
+                    file_settings = _read_settings_file.__wrapped__(*key)
+                else:
+                    file_settings = _read_settings_file(*key)
+                # Copied, since the cached result is shared
+                deep_merge_dicts_inplace(self._settings, self._deep_copy_dict(file_settings))
+            except Exception:
+                logger.exception("Error loading settings")
+        
+        self._rebuild_index()
     
     def _save_settings(self):
         """Save settings to file."""
@@ -82,12 +173,37 @@ class Settings(EventEmitter):
             # Ensure config directory exists
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save settings
-            with open(self.config_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            # Write a temporary file and move it into place, so that a crash
+            # mid-write cannot leave a truncated config file behind
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.config_dir, prefix='.config-', suffix='.json.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_encode_settings(self._settings))
+                # mkstemp creates the file owner-only; keep the permissions
+                # of the existing config file, or those of a new file
+                try:
+                    mode = self.config_file.stat().st_mode & 0o777
+                except FileNotFoundError:
+                    mode = _default_file_mode()
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.config_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            finally:
+                _read_settings_file.cache_clear()
                 
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        except Exception:
+            logger.exception("Error saving settings")
+    
+    def _schedule_save(self):
+        """Save settings after SAVE_DELAY, together with any later changes."""
+        with self._lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.save)
+                self._save_timer.start()
     
     def _deep_copy_dict(self, d: Dict) -> Dict:
         """Deep copy a dictionary."""
@@ -95,17 +211,50 @@ class Settings(EventEmitter):
         for key, value in d.items():
             if isinstance(value, dict):
                 result[key] = self._deep_copy_dict(value)
+            elif isinstance(value, list):
+                # Lists are copied too, so that e.g. the shared defaults'
+                # lists are never modified through a Settings instance
+                result[key] = value.copy()
             else:
                 result[key] = value
         return result
     
-    def _merge_settings(self, target: Dict, source: Dict):
-        """Merge source settings into target settings."""
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._merge_settings(target[key], value)
+    def _rebuild_index(self):
+        """Rebuild the flat key indexes from the settings tree."""
+        self._flat = {}
+        self._groups = {}
+        self._index_subtree('', self._settings)
+    
+    def _index_subtree(self, prefix: str, d: Dict):
+        """Add all keys of a settings subtree to the flat indexes."""
+        for key, value in d.items():
+            # Interned, so lookups with literal keys match on identity
+            path = sys.intern(f"{prefix}.{key}" if prefix else key)
+            if isinstance(value, dict):
+                self._groups[path] = value
+                self._index_subtree(path, value)
             else:
-                target[key] = value
+                self._flat[path] = value
+    
+    def _unindex(self, key: str):
+        """Remove a key and its subtree from the flat indexes."""
+        self._flat.pop(key, None)
+        if self._groups.pop(key, None) is not None:
+            prefix = key + '.'
+            for index in (self._flat, self._groups):
+                for path in [path for path in index if path.startswith(prefix)]:
+                    del index[path]
+    
+    def _reindex(self, key: str, value: Any) -> str:
+        """Replace a key and its subtree in the flat indexes; return the interned key."""
+        self._unindex(key)
+        key = sys.intern(key)
+        if isinstance(value, dict):
+            self._groups[key] = value
+            self._index_subtree(key, value)
+        else:
+            self._flat[key] = value
+        return key
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -121,18 +270,17 @@ class Settings(EventEmitter):
         Returns
         -------
         Any
-            The setting value.
+            The setting value. Groups (e.g. 'appearance') are returned as
+            copies; change them through ``set`` or ``update``.
         """
-        keys = key.split('.')
-        current = self._settings
-        
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            group = self._groups.get(key)
+            if group is None:
                 return default
-        
-        return current
+            # Copied, so changes cannot bypass the flat index
+            return self._deep_copy_dict(group)
+        return value
     
     def set(self, key: str, value: Any, save: bool = True):
         """
@@ -145,27 +293,37 @@ class Settings(EventEmitter):
         value : Any
             Value to set.
         save : bool, optional
-            Whether to save settings to file immediately. Default is True.
+            Whether to save settings to file. The save is deferred by
+            SAVE_DELAY so that consecutive changes are written once; call
+            ``save()`` to write immediately. Default is True.
         """
+        if isinstance(value, dict):
+            # Stored as a copy, so the caller's dict stays out of the index
+            value = self._deep_copy_dict(value)
         keys = key.split('.')
-        current = self._settings
-        
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
-        
-        # Set the value
-        old_value = current.get(keys[-1])
-        current[keys[-1]] = value
+        with self._lock:
+            current = self._settings
+            
+            # Navigate to the parent of the target key
+            for i, k in enumerate(keys[:-1]):
+                if k not in current:
+                    current[k] = {}
+                    self._groups['.'.join(keys[:i + 1])] = current[k]
+                current = current[k]
+            
+            # Set the value
+            old_value = current.get(keys[-1])
+            current[keys[-1]] = value
+            
+            # Update the flat indexes
+            key = self._reindex(key, value)
         
         # Emit change event
         self.emit('setting_changed', key=key, value=value, old_value=old_value)
         
         # Save if requested
         if save:
-            self._save_settings()
+            self._schedule_save()
     
     def has(self, key: str) -> bool:
         """
@@ -181,16 +339,7 @@ class Settings(EventEmitter):
         bool
             True if the key exists.
         """
-        keys = key.split('.')
-        current = self._settings
-        
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return False
-        
-        return True
+        return key in self._flat or key in self._groups
     
     def remove(self, key: str, save: bool = True):
         """
@@ -201,25 +350,31 @@ class Settings(EventEmitter):
         key : str
             Setting key in dot notation.
         save : bool, optional
-            Whether to save settings to file immediately. Default is True.
+            Whether to save settings to file. The save is deferred by
+            SAVE_DELAY so that consecutive changes are written once; call
+            ``save()`` to write immediately. Default is True.
         """
         keys = key.split('.')
-        current = self._settings
+        with self._lock:
+            current = self._settings
+            
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                if isinstance(current, dict) and k in current:
+                    current = current[k]
+                else:
+                    return  # Key doesn't exist
+            
+            # Remove the key
+            if not (isinstance(current, dict) and keys[-1] in current):
+                return
+            old_value = current.pop(keys[-1])
+            self._unindex(key)
         
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return  # Key doesn't exist
+        self.emit('setting_removed', key=key, value=old_value)
         
-        # Remove the key
-        if isinstance(current, dict) and keys[-1] in current:
-            old_value = current.pop(keys[-1])
-            self.emit('setting_removed', key=key, value=old_value)
-            
-            if save:
-                self._save_settings()
+        if save:
+            self._schedule_save()
     
     def reset_to_defaults(self, save: bool = True):
         """
@@ -228,13 +383,17 @@ class Settings(EventEmitter):
         Parameters
         ----------
         save : bool, optional
-            Whether to save settings to file immediately. Default is True.
+            Whether to save settings to file. The save is deferred by
+            SAVE_DELAY so that consecutive changes are written once; call
+            ``save()`` to write immediately. Default is True.
         """
-        self._settings = self._deep_copy_dict(self._defaults)
+        with self._lock:
+            self._settings = self._deep_copy_dict(self._defaults)
+            self._rebuild_index()
         self.emit('settings_reset')
         
         if save:
-            self._save_settings()
+            self._schedule_save()
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -256,17 +415,37 @@ class Settings(EventEmitter):
         settings : Dict[str, Any]
             Settings to update.
         save : bool, optional
-            Whether to save settings to file immediately. Default is True.
+            Whether to save settings to file. The save is deferred by
+            SAVE_DELAY so that consecutive changes are written once; call
+            ``save()`` to write immediately. Default is True.
         """
-        self._merge_settings(self._settings, settings)
+        if settings:
+            # Merged as a copy, so the caller's dicts stay out of the index
+            new_settings = self._deep_copy_dict(settings)
+            with self._lock:
+                current = self._settings
+                if any(isinstance(value, dict) and isinstance(current.get(key), dict)
+                       for key, value in new_settings.items()):
+                    deep_merge_dicts_inplace(current, new_settings)
+                    self._rebuild_index()
+                else:
+                    # No groups to merge: every key is replaced as a whole,
+                    # so only those keys need reindexing
+                    current.update(new_settings)
+                    for key, value in new_settings.items():
+                        self._reindex(key, value)
         self.emit('settings_updated', settings=settings)
         
         if save:
-            self._save_settings()
+            self._schedule_save()
     
     def save(self):
-        """Save settings to file."""
-        self._save_settings()
+        """Save settings to file now, including any pending deferred save."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._save_settings()
 
 
 # Global settings instance
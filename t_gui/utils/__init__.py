@@ -4,4 +4,4 @@ Utility functions and classes for T-GUI.
 
 from .misc import *
 
-__all__ = ['ensure_list', 'deep_merge_dicts', 'safe_import', 'get_file_extension']
+__all__ = ['ensure_list', 'deep_merge_dicts', 'deep_merge_dicts_inplace', 'safe_import', 'get_file_extension']
@@ -3,11 +3,19 @@ Miscellaneous utility functions.
 """
 
 import importlib
+import os
+import re
 import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 
 
+# Keyword arguments for ``dataclass`` that give instances ``__slots__``
+# where supported (Python 3.10+); on older versions they keep a __dict__
+DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 def ensure_list(obj: Any) -> List[Any]:
     """
     Ensure an object is a list.
@@ -49,20 +57,64 @@ def deep_merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
         Merged dictionary.
     """
     result = dict1.copy()
+    # Without dict values in dict2 (e.g. when it is empty) nothing is merged
+    # recursively, so a single update gives the same result as the loop
+    if not any(isinstance(value, dict) for value in dict2.values()):
+        result.update(dict2)
+        return result
     
     for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge_dicts(result[key], value)
+        current = result.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            result[key] = deep_merge_dicts(current, value)
         else:
             result[key] = value
     
     return result
 
 
+def deep_merge_dicts_inplace(target: Dict, source: Dict) -> Dict:
+    """
+    Deep merge a dictionary into another, in place.
+    
+    Unlike ``deep_merge_dicts``, nothing is copied: nested dicts of
+    ``target`` are updated directly, and values from ``source`` are
+    stored by reference.
+    
+    Parameters
+    ----------
+    target : Dict
+        Dictionary to merge into.
+    source : Dict
+        Dictionary to merge (takes precedence).
+        
+    Returns
+    -------
+    Dict
+        ``target``.
+    """
+    if not source or source is target:
+        return target
+    
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            deep_merge_dicts_inplace(current, value)
+        else:
+            target[key] = value
+    
+    return target
+
+
+@lru_cache(maxsize=None)
 def safe_import(module_name: str, attribute: Optional[str] = None) -> Optional[Any]:
     """
     Safely import a module or attribute.
     
+    Results are cached, including failures, so repeated calls (e.g. for
+    an optional dependency that is not installed) return immediately.
+    Call ``safe_import.cache_clear()`` to retry after installing one.
+    
     Parameters
     ----------
     module_name : str
@@ -84,6 +136,10 @@ def safe_import(module_name: str, attribute: Optional[str] = None) -> Optional[A
         return None
 
 
+# Separators stripped from the end of a path by get_file_extension
+_PATH_SEPARATORS = os.sep + (os.altsep or '')
+
+
 def get_file_extension(file_path: Union[str, Path]) -> str:
     """
     Get the file extension from a path.
@@ -98,8 +154,16 @@ def get_file_extension(file_path: Union[str, Path]) -> str:
     str
         File extension (without the dot).
     """
-    path = Path(file_path)
-    return path.suffix.lstrip('.')
+    # Same rule as Path(file_path).suffix, without building a Path: the
+    # text after the last dot of the final component, unless that dot
+    # starts or ends the name
+    name = os.path.basename(os.fspath(file_path).rstrip(_PATH_SEPARATORS))
+    i = name.rfind('.')
+    return name[i + 1:] if 0 < i < len(name) - 1 else ''
+
+
+# Units of format_file_size, in steps of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -118,16 +182,12 @@ def format_file_size(size_bytes: int) -> str:
     """
     if size_bytes == 0:
         return "0 B"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
-    
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
-    
-    return f"{size:.1f} {size_names[i]}"
+    # Each unit is 2**10 times the previous one
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << 10 * i):.1f} {_SIZE_UNITS[i]}"
 
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
@@ -148,7 +208,47 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
     float
         Clamped value.
     """
-    return max(min_value, min(value, max_value))
+    # Same result as max(min_value, min(value, max_value)), including for
+    # NaN and for min_value > max_value, without the two builtin calls
+    if max_value < value:
+        value = max_value
+    return value if value > min_value else min_value
+
+
+def clamp_array(values: Any, min_value: float, max_value: float) -> Any:
+    """
+    Clamp all elements of an array between min and max.
+    
+    Use this instead of calling ``clamp`` per element.
+    
+    Parameters
+    ----------
+    values : array_like
+        Values to clamp.
+    min_value : float
+        Minimum value.
+    max_value : float
+        Maximum value.
+        
+    Returns
+    -------
+    numpy.ndarray
+        Clamped values.
+    """
+    # Imported here so that importing the utilities does not load NumPy
+    import numpy as np
+    
+    return np.clip(values, min_value, max_value)
+
+
+# Built-in types is_sequence accepts without calling iter()
+_ITERABLE_TYPES = frozenset({list, tuple, set, frozenset, dict, range})
+
+
+@lru_cache(maxsize=256)
+def _may_be_iterable(cls: type) -> bool:
+    """Check whether iter() can accept instances of a type, without raising."""
+    return getattr(cls, '__iter__', None) is not None or hasattr(cls, '__getitem__')
 
 
 def is_sequence(obj: Any) -> bool:
@@ -165,6 +265,14 @@ def is_sequence(obj: Any) -> bool:
     bool
         True if object is a sequence.
     """
+    cls = type(obj)
+    if cls in _ITERABLE_TYPES:
+        return True
+    if cls is str or cls is bytes:
+        return False
+    if not _may_be_iterable(cls):
+        return False
+    
     try:
         iter(obj)
         return not isinstance(obj, (str, bytes))
@@ -189,6 +297,16 @@ def get_class_name(obj: Any) -> str:
     return obj.__class__.__name__
 
 
+# '#rgb' or '#rrggbb'
+_match_hex_color = re.compile(r'#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})').fullmatch
+
+# Color names accepted by validate_color (simplified)
+_NAMED_COLORS = frozenset({
+    'red', 'green', 'blue', 'yellow', 'cyan', 'magenta',
+    'black', 'white', 'gray', 'grey', 'orange', 'purple'
+})
+
+
 def validate_color(color: Any) -> bool:
     """
     Validate if a color specification is valid.
@@ -205,19 +323,11 @@ def validate_color(color: Any) -> bool:
     """
     if isinstance(color, str):
         # Check hex color
-        if color.startswith('#') and len(color) in [4, 7]:
-            try:
-                int(color[1:], 16)
-                return True
-            except ValueError:
-                return False
+        if color.startswith('#'):
+            return _match_hex_color(color) is not None
         
         # Check named colors (simplified)
-        named_colors = {
-            'red', 'green', 'blue', 'yellow', 'cyan', 'magenta',
-            'black', 'white', 'gray', 'grey', 'orange', 'purple'
-        }
-        return color.lower() in named_colors
+        return color.lower() in _NAMED_COLORS
     
     elif isinstance(color, (list, tuple)):
         # Check RGB/RGBA
@@ -0,0 +1,163 @@
+"""
+NumPy arrays backed by shared memory.
+
+These allow array payloads (e.g. image layer data) to be handed between
+processes by name instead of being pickled and copied.
+
+The process that creates a block owns it and is responsible for calling
+``unlink()`` once the other processes have attached; attaching never
+takes over that responsibility.
+"""
+
+import ctypes
+import os
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Set, Tuple
+
+import numpy as np
+
+# Names of the blocks created by this process. Their registration with
+# the resource tracker belongs to the creator and is removed by unlink().
+_created_names: Set[str] = set()
+
+
+class _SharedBlock:
+    """
+    Mapping of a shared memory block, owned by the arrays viewing it.
+
+    Arrays are created from the block's ``__array_interface__``, so the
+    block is the final ``.base`` of every array viewing the memory,
+    including plain ndarrays derived with ``np.asarray``, slicing or
+    ``view``. The handle is closed, and the memory unmapped, only when the
+    last of them has been collected.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, shape: Tuple[int, ...], dtype):
+        self.shm = shm
+        dtype = np.dtype(dtype)
+        # Holds a buffer export, so the mapping cannot be closed while
+        # the block is alive
+        self._anchor = ctypes.c_char.from_buffer(shm.buf)
+        self.__array_interface__ = {
+            'version': 3,
+            'shape': tuple(shape),
+            'typestr': dtype.str,
+            'descr': dtype.descr,
+            'data': (ctypes.addressof(self._anchor), False),
+        }
+
+    def __del__(self):
+        if getattr(self, '_anchor', None) is not None:
+            self._anchor = None
+            self.shm.close()
+
+
+def shared_block_of(array: np.ndarray) -> Optional[_SharedBlock]:
+    """
+    Get the shared memory block an array views, if any.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Any array, including plain ndarrays derived from a SharedArray.
+
+    Returns
+    -------
+    _SharedBlock or None
+        The block at the end of the array's ``.base`` chain.
+    """
+    base = array
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return base if isinstance(base, _SharedBlock) else None
+
+
+class SharedArray(np.ndarray):
+    """
+    Array view of a shared memory block.
+
+    The block stays mapped for as long as this array or any array derived
+    from it is alive, whether or not the derived arrays are SharedArrays.
+    """
+
+    @property
+    def shm_name(self) -> Optional[str]:
+        """Get the name of the underlying shared memory block."""
+        block = shared_block_of(self)
+        return block.shm.name if block is not None else None
+
+    def unlink(self):
+        """
+        Request destruction of the shared memory block.
+
+        Only the creating process should call this. Existing mappings (in
+        this or other processes) remain valid until they are released; the
+        block can no longer be attached by name.
+        """
+        block = shared_block_of(self)
+        if block is not None:
+            block.shm.unlink()
+            _created_names.discard(block.shm.name)
+
+
+def _wrap(shm: shared_memory.SharedMemory, shape: Tuple[int, ...], dtype) -> SharedArray:
+    """Create a SharedArray viewing the given shared memory handle."""
+    return np.asarray(_SharedBlock(shm, shape, dtype)).view(SharedArray)
+
+
+def create_shared_array(shape: Tuple[int, ...], dtype=np.float64) -> SharedArray:
+    """
+    Allocate an array in a new shared memory block.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Array shape.
+    dtype : data-type, optional
+        Array data type. Default is float64.
+
+    Returns
+    -------
+    SharedArray
+        The uninitialized array. Pass ``array.shm_name`` to another
+        process, and call ``array.unlink()`` once it has attached.
+    """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    _created_names.add(shm.name)
+    return _wrap(shm, shape, dtype)
+
+
+def attach_shared_array(name: str, shape: Tuple[int, ...], dtype) -> SharedArray:
+    """
+    Attach to an array in an existing shared memory block.
+
+    The caller does not become an owner of the block: it must not call
+    ``unlink()``, and exiting does not destroy the block.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block.
+    shape : tuple of int
+        Array shape.
+    dtype : data-type
+        Array data type.
+
+    Returns
+    -------
+    SharedArray
+        Array viewing the shared memory block, without copying.
+    """
+    try:
+        # Python 3.13+: the creator is responsible for unlinking
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == 'posix' and name not in _created_names:
+            # Older versions register attached blocks with the resource
+            # tracker too, which would unlink the block when this process
+            # exits and warn about a leak; the registration of a block
+            # created here is the creator's and is kept
+            resource_tracker.unregister(shm._name, "shared_memory")
+    return _wrap(shm, shape, dtype)
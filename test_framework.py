@@ -82,6 +82,35 @@ def test_viewer():
         assert len(viewer.layers) == 1, "Expected 1 layer after removal"
         print("✓ Layer removal working correctly")
         
+        # A layer can be added to a viewer only once
+        try:
+            viewer.add_layer(points_layer)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected adding a layer twice to fail")
+        assert viewer.layers == (points_layer,), "Expected the layers to be unchanged"
+        assert list(points_layer._viewers) == [viewer], "Expected the layer's viewers to be unchanged"
+        viewer.remove_layer(points_layer)
+        assert not viewer.layers and viewer.get_layer_by_name("Test Points") is None, \
+            "Expected no stale entries after removal"
+        print("✓ Duplicate layers are rejected")
+        
+        # Layers hold their viewers weakly, so a closed viewer can be freed
+        import gc
+        import weakref
+        
+        closed = Viewer()
+        kept_layer = closed.add_image(np.zeros((2, 2)), name="kept")
+        closed_ref = weakref.ref(closed)
+        closed.close()
+        del closed
+        gc.collect()
+        assert closed_ref() is None, "Expected the closed viewer to be freed"
+        assert not list(kept_layer._viewers), "Expected no viewers left on the layer"
+        kept_layer.name = "renamed"
+        print("✓ Layers do not keep closed viewers alive")
+        
         return True
         
     except Exception as e:
@@ -89,6 +118,164 @@ def test_viewer():
         return False
 
 
+def test_layer_events():
+    """Test layer change notifications."""
+    print("\nTesting layer events...")
+    
+    try:
+        from t_gui.components.viewer import Viewer
+        
+        # clear_layers reports each layer to layer_removed listeners
+        viewer = Viewer()
+        layers = [viewer.add_image(np.zeros((2, 2)), name=f"L{i}") for i in range(3)]
+        removed, changed = [], []
+        
+        # Callbacks are held weakly, so keep them referenced
+        def on_removed(event):
+            removed.append((event.data['layer'], event.data['index']))
+        
+        def on_changed(event):
+            changed.append(event.data['removed'])
+        
+        viewer.connect('layer_removed', on_removed)
+        viewer.connect('layers_changed', on_changed)
+        viewer.clear_layers()
+        assert removed == [(layer, 0) for layer in layers], "Expected one layer_removed per layer"
+        assert changed == [layers], "Expected layers_changed alongside layer_removed"
+        assert len(viewer.layers) == 0, "Expected no layers after clearing"
+        print("✓ clear_layers emits layer_removed per layer and layers_changed")
+        
+        # Without layer_removed listeners, a single layers_changed is emitted
+        viewer = Viewer()
+        layers = [viewer.add_image(np.zeros((2, 2)), name=f"L{i}") for i in range(3)]
+        changed = []
+        viewer.connect('layers_changed', on_changed)
+        viewer.clear_layers()
+        assert changed == [layers], "Expected a single layers_changed event"
+        print("✓ clear_layers emits one layers_changed otherwise")
+        
+        # batch_updates coalesces changes into one layers_changed event
+        viewer = Viewer()
+        kept = viewer.add_image(np.zeros((2, 2)), name="kept")
+        dropped = viewer.add_image(np.zeros((2, 2)), name="dropped")
+        events = []
+        
+        def on_event(event):
+            events.append((event.type, dict(event.data)))
+        
+        for event_type in ('layer_added', 'layer_removed', 'layers_changed', 'active_layer_changed'):
+            viewer.connect(event_type, on_event)
+        with viewer.batch_updates():
+            with viewer.batch_updates():
+                added = viewer.add_image(np.zeros((2, 2)), name="added")
+            viewer.remove_layer(dropped)
+            assert not events, "Expected no events inside the batch"
+        assert [event_type for event_type, _ in events] == ['layers_changed', 'active_layer_changed'], \
+            "Expected one layers_changed and one active_layer_changed"
+        assert events[0][1] == {'added': [added], 'removed': [dropped]}, "Expected the batched changes"
+        assert events[1][1] == {'layer': added, 'old_layer': dropped}, "Expected the net active change"
+        assert viewer.layers == (kept, added), "Expected the batched layers to be applied"
+        
+        # An empty batch emits nothing
+        events.clear()
+        with viewer.batch_updates():
+            pass
+        assert not events, "Expected no events for an empty batch"
+        print("✓ batch_updates coalesces layer events")
+        
+        # set_selection emits one diffed selection_changed event
+        from t_gui.components import LayerList
+        
+        layer_list = LayerList(viewer)
+        outsider = Viewer().add_image(np.zeros((2, 2)))
+        changes = []
+        
+        def on_selection(event):
+            changes.append(event.data)
+        
+        layer_list.connect('selection_changed', on_selection)
+        layer_list.set_selection([kept, outsider])
+        layer_list.set_selection([kept, added])
+        layer_list.set_selection([kept, added])
+        assert layer_list.selection == [kept, added], "Expected the new selection"
+        assert changes == [
+            {'selection': [kept], 'added': [kept], 'removed': []},
+            {'selection': [kept, added], 'added': [added], 'removed': []},
+        ], f"Unexpected selection events {changes}"
+        layer_list.set_selection([added])
+        assert changes[-1] == {'selection': [added], 'added': [], 'removed': [kept]}, \
+            "Expected the deselected layer to be reported"
+        print("✓ set_selection emits a single diffed event")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Layer events test failed: {e}")
+        return False
+
+
+def test_shared_image_data():
+    """Test image layers backed by shared memory."""
+    print("\nTesting shared memory image layers...")
+    
+    try:
+        import gc
+        from t_gui.components.viewer import Viewer
+        from t_gui.utils.shared_array import create_shared_array
+        
+        viewer = Viewer()
+        data = create_shared_array((20, 20), dtype=np.float32)
+        data[:] = 1.5
+        layer = viewer.add_image_shm(data.shm_name, data.shape, data.dtype)
+        data.unlink()
+        
+        # The layer's data must keep the block mapped on its own
+        del data
+        gc.collect()
+        assert float(layer.data.sum()) == 600.0, "Expected the shared data to stay readable"
+        print("✓ Shared memory image data outlives the creating array")
+        
+        # Attached arrays view the same memory as the creating array
+        from t_gui.utils.shared_array import attach_shared_array
+        
+        source = create_shared_array((3, 4), dtype=np.int32)
+        try:
+            attached = attach_shared_array(source.shm_name, source.shape, source.dtype)
+            assert attached.shm_name == source.shm_name, "Expected the same block name"
+            source[:] = 7
+            assert int(attached.sum()) == 84, "Expected writes to be visible through the attached array"
+            attached[0, 0] = 0
+            assert int(np.asarray(source)[0, 0]) == 0, "Expected writes to be shared both ways"
+        finally:
+            source.unlink()
+        print("✓ Shared arrays can be attached by name")
+        
+        # Layers view the block in place; other float types are rejected
+        source = create_shared_array((2, 2), dtype=np.float32)
+        try:
+            layer = Viewer().add_image_shm(source.shm_name, source.shape, source.dtype)
+            source[:] = 5
+            assert float(layer.data.sum()) == 20.0, "Expected producer writes to be visible"
+            wide = create_shared_array((2, 2), dtype=np.float64)
+            try:
+                Viewer().add_image_shm(wide.shm_name, wide.shape, wide.dtype)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Expected float64 shared images to be rejected")
+            finally:
+                wide.unlink()
+        finally:
+            source.unlink()
+        print("✓ Shared memory images are viewed in place")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Shared memory image test failed: {e}")
+        return False
+
+
 def test_events():
     """Test event system."""
     print("\nTesting event system...")
@@ -112,6 +299,87 @@ def test_events():
         assert events_received[0].type == 'test_event', "Expected test_event type"
         print("✓ Event emission and handling working correctly")
         
+        # Events emitted without data are fresh, writable objects
+        def tag_handler(event):
+            event.data['seen'] = True
+        
+        emitter.connect('empty_event', event_handler)
+        emitter.connect('empty_event', tag_handler)
+        emitter.emit('empty_event')
+        emitter.emit('empty_event')
+        first, second = events_received[1:]
+        assert first is not second, "Expected a new event per emission"
+        assert first.data == {'seen': True}, "Expected handlers to be able to write event data"
+        print("✓ Events without data are allocated per emission")
+        
+        # Higher priorities run first, equal priorities in connection order
+        order = []
+        
+        def low(event):
+            order.append('low')
+        
+        def first(event):
+            order.append('first')
+        
+        def second(event):
+            order.append('second')
+        
+        def high(event):
+            order.append('high')
+        
+        emitter.connect('ordered', low, priority=-1)
+        token = emitter.connect('ordered', first)
+        emitter.connect('ordered', second)
+        emitter.connect('ordered', high, priority=5)
+        emitter.emit('ordered')
+        assert order == ['high', 'first', 'second', 'low'], f"Unexpected order {order}"
+        
+        # Connecting again returns the existing token; the token disconnects
+        assert emitter.connect('ordered', first, priority=10) is token, "Expected the same token"
+        emitter.disconnect('ordered', token)
+        order.clear()
+        emitter.emit('ordered')
+        assert order == ['high', 'second', 'low'], f"Unexpected order {order}"
+        
+        # Weak connections go away with their callback
+        def transient(event):
+            pass
+        
+        emitter.connect('transient', transient)
+        assert emitter.has_listeners('transient'), "Expected a listener"
+        del transient
+        assert not emitter.has_listeners('transient'), "Expected the dead callback to be removed"
+        
+        # Methods of builtin types disconnect by value, like bound methods
+        received = []
+        emitter.connect('builtin', received.append, weak=False)
+        emitter.disconnect('builtin', received.append)
+        emitter.emit('builtin')
+        assert not received and not emitter.has_listeners('builtin'), \
+            "Expected the builtin method to be disconnected"
+        print("✓ Callback priorities and connection tokens working correctly")
+        
+        # connect_many connects each callback once per event type
+        calls = []
+        
+        def on_a(event):
+            calls.append(('a', event.type))
+        
+        def on_b(event):
+            calls.append(('b', event.type))
+        
+        existing = emitter.connect('bulk_one', on_a)
+        tokens = emitter.connect_many([
+            ('bulk_one', on_a), ('bulk_one', on_b), ('bulk_two', on_a), ('bulk_one', on_b),
+        ])
+        assert tokens[0] is existing, "Expected the existing token for a connected callback"
+        assert tokens[1] is tokens[3], "Expected duplicate pairs to share a token"
+        emitter.emit('bulk_one')
+        emitter.emit('bulk_two')
+        assert calls == [('a', 'bulk_one'), ('b', 'bulk_one'), ('a', 'bulk_two')], \
+            f"Unexpected calls {calls}"
+        print("✓ connect_many deduplicates connections")
+        
         return True
         
     except Exception as e:
@@ -139,6 +407,102 @@ def test_settings():
         assert retrieved == 'test_data', "Expected test_data"
         print("✓ Settings modification working correctly")
         
+        # Edits keeping the file's size and modification time are reloaded
+        import os
+        import tempfile
+        from pathlib import Path
+        from t_gui.settings.config import Settings
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            config_file = Path(tmp, "config.json")
+            config_file.write_text('{"test": {"value": "aaaa"}}')
+            stamp = config_file.stat().st_mtime_ns
+            first = Settings(config_dir=Path(tmp))
+            assert first.get('test.value') == 'aaaa', "Expected the file's value"
+            first.set('test.value', 'changed', save=False)
+            
+            config_file.write_text('{"test": {"value": "bbbb"}}')
+            os.utime(config_file, ns=(stamp, stamp))
+            second = Settings(config_dir=Path(tmp))
+            assert second.get('test.value') == 'bbbb', "Expected the edited value"
+            assert Settings(config_dir=Path(tmp)).get('test.value') == 'bbbb', \
+                "Expected the parsed file to be unaffected by set()"
+        print("✓ Settings files are reloaded after same-size edits")
+        
+        # The flat key index follows changes to groups and leaves
+        with tempfile.TemporaryDirectory() as tmp:
+            local = Settings(config_dir=Path(tmp))
+            local.set('a.b.c', 1, save=False)
+            assert local.get('a.b.c') == 1, "Expected the nested value"
+            assert local.get('a.b') == {'c': 1}, "Expected the group"
+            local.set('a.b', {'d': 2}, save=False)
+            assert not local.has('a.b.c'), "Expected the replaced subtree to be unindexed"
+            assert local.get('a.b.d') == 2, "Expected the new subtree to be indexed"
+            local.remove('a', save=False)
+            assert not local.has('a.b') and not local.has('a.b.d'), "Expected the removed group to be unindexed"
+            assert local.get('a.b.d', 'missing') == 'missing', "Expected the default"
+            
+            # Groups are copied in and out, so the index cannot go stale
+            local.get('appearance')['theme'] = 'light'
+            assert local.get('appearance')['theme'] == 'dark', "Expected get() to return a copy"
+            group = {'x': 1}
+            local.set('owned', group, save=False)
+            local.update({'merged': group}, save=False)
+            group['y'] = 2
+            assert not local.has('owned.y') and local.get('owned') == {'x': 1}, \
+                "Expected set() to store a copy"
+            assert local.get('merged') == {'x': 1}, "Expected update() to store a copy"
+        print("✓ Settings flat index working correctly")
+        
+        # update() replaces disjoint keys and merges into existing groups
+        with tempfile.TemporaryDirectory() as tmp:
+            local = Settings(config_dir=Path(tmp))
+            local.set('plain', 1, save=False)
+            local.update({'plain': {'x': 1}, 'extra': 2}, save=False)
+            assert local.get('plain.x') == 1 and local.get('extra') == 2, "Expected the disjoint keys"
+            local.update({'plain': 3}, save=False)
+            assert local.get('plain') == 3 and not local.has('plain.x'), \
+                "Expected the replaced group to be unindexed"
+            local.update({'appearance': {'theme': 'light'}}, save=False)
+            assert local.get('appearance.theme') == 'light', "Expected the merged value"
+            assert local.get('appearance.font_size') == 10, "Expected the other group keys to remain"
+        print("✓ Settings update working correctly")
+        
+        # Saves are deferred and coalesced into one atomic write
+        import json
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            local = Settings(config_dir=Path(tmp))
+            local.set('saved.first', 1)
+            timer = local._save_timer
+            local.set('saved.second', 2)
+            assert local._save_timer is timer, "Expected one pending save for both changes"
+            assert not local.config_file.exists(), "Expected the save to be deferred"
+            timer.join()
+            assert json.loads(local.config_file.read_text())['saved'] == {'first': 1, 'second': 2}, \
+                "Expected both changes in the saved file"
+            assert local._save_timer is None, "Expected no pending save"
+            
+            local.set('saved.third', 3)
+            local.save()
+            assert local._save_timer is None, "Expected save() to cancel the pending save"
+            assert json.loads(local.config_file.read_text())['saved']['third'] == 3, \
+                "Expected save() to write immediately"
+            assert [p.name for p in Path(tmp).iterdir()] == ['config.json'], \
+                "Expected no temporary files to be left behind"
+            
+            # The atomic write keeps the file's permissions
+            if os.name == 'posix':
+                umask = os.umask(0o022)
+                os.umask(umask)
+                assert local.config_file.stat().st_mode & 0o777 == 0o666 & ~umask, \
+                    "Expected a new config file to follow the umask"
+                os.chmod(local.config_file, 0o640)
+                local.save()
+                assert local.config_file.stat().st_mode & 0o777 == 0o640, \
+                    "Expected the existing permissions to be kept"
+        print("✓ Settings saves are deferred and coalesced")
+        
         return True
         
     except Exception as e:
@@ -146,6 +510,50 @@ def test_settings():
         return False
 
 
+def test_utils():
+    """Test utility functions."""
+    print("\nTesting utility functions...")
+    
+    try:
+        from t_gui.utils.misc import deep_merge_dicts
+        
+        # Flat and nested merges give the same result as a key-by-key merge
+        base = {'a': 1, 'group': {'x': 1, 'y': 2}}
+        merged = deep_merge_dicts(base, {'a': 2, 'b': 3})
+        assert merged == {'a': 2, 'b': 3, 'group': {'x': 1, 'y': 2}}, "Expected a flat merge"
+        merged = deep_merge_dicts(base, {'group': {'y': 3, 'z': 4}})
+        assert merged == {'a': 1, 'group': {'x': 1, 'y': 3, 'z': 4}}, "Expected a nested merge"
+        assert deep_merge_dicts(base, {'a': {'n': 1}})['a'] == {'n': 1}, "Expected a value replaced by a dict"
+        assert deep_merge_dicts(base, {}) == base and deep_merge_dicts(base, {}) is not base, \
+            "Expected a copy when there is nothing to merge"
+        assert base == {'a': 1, 'group': {'x': 1, 'y': 2}}, "Expected the inputs to be unchanged"
+        print("✓ deep_merge_dicts working correctly")
+        
+        from t_gui.utils.misc import is_sequence
+        
+        class OldStyle:
+            def __getitem__(self, index):
+                raise IndexError
+        
+        class NotIterable:
+            __iter__ = None
+        
+        class Text(str):
+            pass
+        
+        sequences = [[], (), set(), {}, range(2), np.zeros(2), iter([]), OldStyle()]
+        others = ["text", b"bytes", Text("text"), 1, 1.5, None, object(), NotIterable()]
+        assert all(is_sequence(obj) for obj in sequences), "Expected sequences to be detected"
+        assert not any(is_sequence(obj) for obj in others), "Expected non-sequences to be rejected"
+        print("✓ is_sequence working correctly")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Utility test failed: {e}")
+        return False
+
+
 def test_plugins():
     """Test plugin system."""
     print("\nTesting plugin system...")
@@ -164,6 +572,66 @@ def test_plugins():
         plugin_manager.discover_plugins()
         print("✓ Plugin discovery working correctly")
         
+        # A plugin failing at import must not stop the others from loading
+        import logging
+        import tempfile
+        from pathlib import Path
+        from t_gui.plugins.registry import PluginInfo
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "tg_broken_plugin.py").write_text("raise RuntimeError('broken')\n")
+            Path(tmp, "tg_good_plugin.py").write_text("VALUE = 1\n")
+            sys.path.insert(0, tmp)
+            logging.disable(logging.CRITICAL)
+            try:
+                loader = PluginManager()
+                for name in ("tg_broken_plugin", "tg_good_plugin"):
+                    loader.registry.register_plugin(PluginInfo(name=name, module_name=name))
+                loader.load_all_plugins()
+            finally:
+                logging.disable(logging.NOTSET)
+                sys.path.remove(tmp)
+        assert loader.is_plugin_loaded("tg_good_plugin"), "Expected the good plugin to load"
+        assert not loader.is_plugin_loaded("tg_broken_plugin"), "Expected the broken plugin to be skipped"
+        print("✓ Failing plugin imports are skipped")
+        
+        # With strict hook checks, an invalid plugin is rolled back and
+        # does not affect plugins loaded after it
+        from t_gui.plugins import manager
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "tg_invalid_plugin.py").write_text(
+                "from t_gui.plugins import hookimpl\n"
+                "@hookimpl\n"
+                "def t_gui_no_such_hook():\n"
+                "    pass\n"
+            )
+            Path(tmp, "tg_valid_plugin.py").write_text(
+                "from t_gui.plugins import hookimpl\n"
+                "CALLS = []\n"
+                "@hookimpl\n"
+                "def t_gui_get_contributions():\n"
+                "    CALLS.append(1)\n"
+                "    return {}\n"
+            )
+            sys.path.insert(0, tmp)
+            logging.disable(logging.CRITICAL)
+            strict, manager.HOOK_STRICT = manager.HOOK_STRICT, True
+            try:
+                loader = PluginManager()
+                for name in ("tg_invalid_plugin", "tg_valid_plugin"):
+                    loader.registry.register_plugin(PluginInfo(name=name, module_name=name))
+                assert not loader.load_plugin("tg_invalid_plugin"), "Expected the invalid plugin to fail"
+                assert not loader.is_plugin_loaded("tg_invalid_plugin"), "Expected the invalid plugin to be dropped"
+                assert loader.load_plugin("tg_valid_plugin"), "Expected the valid plugin to load"
+                assert not loader.load_plugin("tg_invalid_plugin"), "Expected the invalid plugin to fail again"
+            finally:
+                manager.HOOK_STRICT = strict
+                logging.disable(logging.NOTSET)
+                sys.path.remove(tmp)
+        assert sys.modules["tg_valid_plugin"].CALLS, "Expected the valid plugin's contributions"
+        print("✓ Invalid plugins are rolled back with strict hook checks")
+        
         return True
         
     except Exception as e:
@@ -191,6 +659,27 @@ def test_qt_integration():
         assert window is not None, "Expected main window"
         print("✓ Main window created successfully")
         
+        # Errors building the window in run() reach the caller
+        import logging
+        import t_gui
+        from t_gui._qt import main_window
+        
+        def broken_window():
+            raise RuntimeError("broken window")
+        
+        logging.disable(logging.CRITICAL)
+        main_window.MainWindow = broken_window
+        try:
+            t_gui.run(show=False)
+        except RuntimeError as e:
+            assert str(e) == "broken window", f"Unexpected error {e}"
+        else:
+            raise AssertionError("Expected run() to re-raise the error")
+        finally:
+            main_window.MainWindow = MainWindow
+            logging.disable(logging.NOTSET)
+        print("✓ run() re-raises errors from building the window")
+        
         return True
         
     except ImportError as e:
@@ -209,8 +698,11 @@ def main():
     tests = [
         test_imports,
         test_viewer,
+        test_layer_events,
+        test_shared_image_data,
         test_events,
         test_settings,
+        test_utils,
         test_plugins,
         test_qt_integration,
     ]